@@ -1,23 +1,31 @@
 import streamlit as st
 import pandas as pd
 import altair as alt
-from datetime import datetime
+from datetime import date, datetime
+from typing import Optional
 
-from services.notion_service import list_pages
+from services.notion_service import iter_pages
 from models import Order
+from core.cache import cached_loader
+from services.order_window_service import rollup_orders
+from utils.notion_query import Query
+from core.profiling import span
 
+# Period -> (pandas frequency, number of periods shown)
+CHART_WINDOWS = {"Weekly": ("W", 12), "Monthly": ("M", 12), "Yearly": ("Y", 5)}
 
-@st.cache_data
-def load_orders() -> pd.DataFrame:
-    """Load notion orders into a DataFrame"""
-    raw_orders = list_pages("order", page_size=100)
-    orders = [Order.from_dict(o).to_dict() for o in raw_orders]
 
-    df = pd.DataFrame(orders)
+@cached_loader("order")
+def load_orders(query: Optional[Query] = None, columns: Optional[tuple] = None) -> pd.DataFrame:
+    """
+    Load notion orders (only those matching `query` if given) into a DataFrame,
+    fetching only the properties behind `columns` (all of them by default).
+    """
+    df = Order.frame_from_pages(iter_pages("order", query=query, properties=Order.properties(columns)))
 
     if not df.empty:
         df["Date"] = pd.to_datetime(df["Date"])
-        df["Total Value"] = pd.to_numeric(df["Total Value"], errors="coerce").fillna(0)
+        df["Total Value"] = df["Total Value"].fillna(0)
 
     return df
 
@@ -37,6 +45,12 @@ def group_orders(df: pd.DataFrame, period: str) -> pd.DataFrame:
     return df_grouped
 
 
+def window_start(period: str) -> date:
+    """First day of the visible window of a period, e.g. the Monday 11 weeks ago for Weekly."""
+    freq, periods = CHART_WINDOWS[period]
+    return (pd.Timestamp.today().to_period(freq) - (periods - 1)).start_time.date()
+
+
 def show_orders_chart(streamlit: st):
     streamlit.subheader("Orders by Period")
 
@@ -47,22 +61,24 @@ def show_orders_chart(streamlit: st):
         default="Weekly"
     )
 
-    df = load_orders()
-    if df.empty:
+    period = period or "Weekly"
+
+    # Derived from the daily rollup of the visible window, kept up to date between reruns
+    df_grouped = rollup_orders(period, window_start(period))
+    if df_grouped.empty:
         st.warning("No orders found in Notion.")
         return
 
-    df_grouped = group_orders(df, period)
-
     chart = (
         alt.Chart(df_grouped)
         .mark_line(point=True)
         .encode(
             x="Date:T",
             y="Total Value:Q",
-            tooltip=["Date:T", "Total Value:Q"]
+            tooltip=["Date:T", "Orders:Q", "Total Value:Q"]
         )
         .properties(width="container", height=400)
     )
 
-    streamlit.altair_chart(chart, use_container_width=True)
+    with span("render", "Orders chart"):
+        streamlit.altair_chart(chart, use_container_width=True)
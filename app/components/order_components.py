@@ -2,12 +2,46 @@ import streamlit as st
 import pandas as pd
 
 from core.config import get_settings
-from services.notion_service import list_pages
+from services.async_notion_service import fetch_databases
 from models import Product, Customer, Store
 
 
 def create_order_dialog_state(state: bool) -> None:
     st.session_state["create_order_dialog_open"] = state
+    if state:
+        # Reference data is fetched again each time the dialog is opened
+        st.session_state.pop("create_order_dialog_data", None)
+
+
+def load_order_dialog_data() -> dict:
+    """
+    Products, customers and stores of the order dialog, fetched concurrently
+    once per dialog open and kept in the session, so the reruns triggered by
+    the order editor don't hit Notion.
+    """
+    if "create_order_dialog_data" in st.session_state:
+        return st.session_state["create_order_dialog_data"]
+
+    try:
+        pages = fetch_databases(["product", "customer", "store"], properties={
+            "product": list(Product.properties(["Name", "Price"])),
+            "customer": ["Name"],
+            "store": ["Name"],
+        })
+    except Exception as e:
+        st.error(f"Error fetching order data: {e}")
+        # Not kept, so the next rerun tries again
+        return {"product_options": [], "product_map": {}, "customer_options": [], "store_options": []}
+
+    products = Product.from_pages(pages["product"])
+    data = {
+        "product_options": [p.name for p in products],
+        "product_map": {p.name: p for p in products},  # 🔑 nome -> Product
+        "customer_options": [c.name for c in Customer.from_pages(pages["customer"])],
+        "store_options": [s.name for s in Store.from_pages(pages["store"])],
+    }
+    st.session_state["create_order_dialog_data"] = data
+    return data
 
 
 @st.dialog(
@@ -18,31 +52,12 @@ def create_order_dialog_state(state: bool) -> None:
 def create_order_dialog() -> None:
     """New order dialog"""
 
-    # --- Fetch products ---
-    try:
-        products = [Product.from_dict(p) for p in list_pages("product", page_size=100)]
-        product_options = [p.name for p in products]
-        product_map = {p.name: p for p in products}  # 🔑 nome -> Product
-    except Exception as e:
-        st.error(f"Error fetching products: {e}")
-        product_options = []
-        product_map = {}
-
-    # --- Fetch customers ---
-    try:
-        customers = [Customer.from_dict(c) for c in list_pages("customer", page_size=100)]
-        customer_options = [c.name for c in customers]
-    except Exception as e:
-        st.error(f"Error fetching customers: {e}")
-        customer_options = []
-
-    # --- Fetch stores ---
-    try:
-        stores = [Store.from_dict(c) for c in list_pages("store", page_size=100)]
-        store_options = [c.name for c in stores]
-    except Exception as e:
-        st.error(f"Error fetching stores: {e}")
-        store_options = []
+    # --- Products, customers and stores, fetched once per dialog open ---
+    data = load_order_dialog_data()
+    product_options = data["product_options"]
+    product_map = data["product_map"]
+    customer_options = data["customer_options"]
+    store_options = data["store_options"]
 
     # --- Required Inputs ---
     st.subheader("Required Inputs")
@@ -1,11 +1,20 @@
-import time
 import streamlit as st
+import pandas as pd
+from streamlit.runtime.scriptrunner import get_script_run_ctx
 
-from services.notion_service import list_pages
+from services.notion_service import iter_pages
+from services.relation_service import resolve_relation_names
 from core.config import get_settings
+from core.cache import cached_loader
 from services.category_service import create_category_on_notion
-from services.product_service import create_product_on_notion, edit_product_on_notion, delete_product_on_notion
+from services.product_service import (
+    send_product_create, send_product_update, send_product_archive, record_product_write
+)
+from services.mutation_queue import enqueue_mutation, apply_pending_mutations, pop_mutation_failures
+from services.import_service import read_product_rows, import_products
+from services.reference_service import ReferenceData, get_categories, get_products
 from models import Product, Category
+from utils.notion_query import Query
 
 
 # --- Dialog state management ---
@@ -18,39 +27,102 @@ def edit_product_dialog_state(state: bool = True):
 def delete_product_dialog_state(state: bool = True):
     st.session_state["delete_product_dialog_open"] = state
 
+def import_products_dialog_state(state: bool = True):
+    st.session_state["import_products_dialog_open"] = state
+
+
+# --- Loaders ---
+# Columns shown in the Products table; other properties aren't fetched for it
+PRODUCT_TABLE_COLUMNS = (
+    "ID", "Name", "Price", "Category", "Stock Qty", "Print Time", "Created Time", "Last Edited Time"
+)
+
+
+@cached_loader("product", "category")
+def load_products(query: Query | None = None) -> pd.DataFrame:
+    """
+    Load products from Notion (only those matching `query` if given) and convert category IDs to names.
+    """
+    products = Product.frame_from_pages(
+        iter_pages("product", query=query, properties=Product.properties(PRODUCT_TABLE_COLUMNS))
+    )
+    # Replace category IDs with the first category name, resolved in bulk
+    products["Category"] = resolve_relation_names(products["Category"], "category")
+    return products
+
+
+def load_products_view() -> pd.DataFrame:
+    """Cached products with the writes still in flight applied on top."""
+    return apply_pending_mutations("product", load_products())
+
 
 # --- Helpers ---
-def fetch_categories():
+def _session_id() -> str | None:
+    ctx = get_script_run_ctx()
+    return ctx.session_id if ctx else None
+
+
+def show_mutation_failures() -> None:
+    """Report the background writes of this session that failed."""
+    for message in pop_mutation_failures(_session_id()):
+        st.toast(message, icon="❌")
+
+
+def enqueue_product_mutation(op: str, product: Product, category_name: str | None, description: str) -> None:
+    """Queue a product write and patch the Products view optimistically until it lands."""
+    # API call and page count change of each operation
+    actions = {"create": (send_product_create, +1), "update": (send_product_update, 0), "delete": (send_product_archive, -1)}
+    send, count_delta = actions[op]
+    row = {
+        "ID": product.product_id,
+        "Name": product.name,
+        "Price": product.price,
+        "Category": category_name,
+        "Print Time": product.print_time,
+    }
+    if op != "create":
+        # Only patch the fields this write sets; the others keep their current values
+        row = {column: value for column, value in row.items() if value is not None}
+    enqueue_mutation(
+        db_name="product",
+        op=op,
+        action=lambda: send(product),
+        on_success=lambda response: record_product_write(product, response, count_delta),
+        row=row,
+        description=description,
+        session_id=_session_id(),
+        notion_id=product.notion_id,
+    )
+
+def fetch_categories() -> ReferenceData[Category]:
+    """Shared categories with their lookup indexes, fetched only when missing or stale."""
     try:
-        categories = [Category.from_dict(c) for c in list_pages("category", page_size=100)]
-        options = [c.name for c in categories]
+        return get_categories()
     except Exception as e:
         st.error(f"Error fetching categories: {e}")
-        categories, options = [], []
-    return categories, options
+        return ReferenceData(Category, [])
 
 
-def fetch_products():
+def fetch_products() -> ReferenceData[Product]:
+    """Shared products with their lookup indexes, fetched only when missing or stale."""
     try:
-        products = [Product.from_dict(p) for p in list_pages("product", page_size=100)]
-        options = [p.name for p in products]
+        return get_products()
     except Exception as e:
         st.error(f"Error fetching products: {e}")
-        products, options = [], []
-    return products, options
+        return ReferenceData(Product, [])
 
 
 # --- Dialogs ---
 @st.dialog(title="Create New Product", width="large", on_dismiss=lambda: create_product_dialog_state(False))
 def create_product_dialog() -> None:
-    categories, category_options = fetch_categories()
+    categories = fetch_categories()
 
     st.subheader("Required Inputs")
     name = st.text_input("Enter New Product Name")
     price = st.number_input("Price", min_value=0.0, format="%.2f")
     category = st.selectbox(
         label="Category",
-        options=category_options,
+        options=categories.options,
         accept_new_options=True,
         placeholder="Select a category"
     )
@@ -60,10 +132,10 @@ def create_product_dialog() -> None:
 
     if st.button("Create Product", type="primary", use_container_width=True):
         # Create category if not exists
-        if category not in category_options:
+        if category not in categories:
             category_id = create_category_on_notion(Category(name=category)).get("id")
         else:
-            category_id = next(c.notion_id for c in categories if c.name == category)
+            category_id = categories.id_of(category)
 
         new_product = Product(
             name=name,
@@ -72,31 +144,29 @@ def create_product_dialog() -> None:
             category=[category_id]
         )
 
-        with st.spinner("Creating product..."):
-            create_product_on_notion(new_product)
-            time.sleep(1)
+        enqueue_product_mutation("create", new_product, category, f"create product '{name}'")
+        st.toast(f"Produto '{name}' será criado em segundo plano.", icon="⏳")
 
         create_product_dialog_state(False)
-        st.cache_data.clear()
         st.rerun(scope="app")
 
 
 @st.dialog(title="Edit Product", width="large", on_dismiss=lambda: edit_product_dialog_state(False))
 def edit_product_dialog() -> None:
-    categories, category_options = fetch_categories()
-    products, product_options = fetch_products()
+    categories = fetch_categories()
+    products = fetch_products()
 
     # --- Select the product to edit ---
     selected_index = st.selectbox(
         label="Select Product to Edit",
-        options=list(range(len(product_options))),
-        format_func=lambda i: product_options[i],
+        options=list(range(len(products))),
+        format_func=lambda i: products.options[i],
         placeholder="Select a product to edit",
         accept_new_options=False,
     )
 
     # Get the actual Product object
-    selected_product_obj = products[selected_index]
+    selected_product_obj = products.items[selected_index]
 
     # --- Pre-fill inputs with product data ---
     st.badge(
@@ -118,14 +188,14 @@ def edit_product_dialog() -> None:
     )
 
     # Get category name by id
-    selected_category_name = next((c.name for c in categories if c.notion_id == selected_product_obj.category[0]), None)
+    selected_category_name = categories.name_of(next(iter(selected_product_obj.category or []), None))
 
     # Pre-fill category (selectbox requires index of the option)
-    category_index = category_options.index(selected_category_name)
+    category_index = categories.index_of(selected_category_name)
 
     category = st.selectbox(
         label="Category",
-        options=category_options,
+        options=categories.options,
         index=category_index,
         accept_new_options=True,
         placeholder="Select a category"
@@ -141,43 +211,42 @@ def edit_product_dialog() -> None:
     # --- Edit button ---
     if st.button("Edit Product", type="primary", use_container_width=True):
         # Create category if it does not exist
-        if category not in category_options:
+        if category not in categories:
             category_id = create_category_on_notion(Category(name=category)).get("id")
         else:
-            category_id = next(c.notion_id for c in categories if c.name == category)
+            category_id = categories.id_of(category)
 
         updated_product = Product(
             notion_id=selected_product_obj.notion_id,
+            product_id=selected_product_obj.product_id,
             name=new_name,
             price=price,
             print_time=print_time,
             category=[category_id]
         )
 
-        with st.spinner("Editing product..."):
-            edit_product_on_notion(updated_product)
-            time.sleep(1)
+        enqueue_product_mutation("update", updated_product, category, f"edit product '{new_name}'")
+        st.toast(f"Produto '{new_name}' será editado em segundo plano.", icon="⏳")
 
         edit_product_dialog_state(False)
-        st.cache_data.clear()
         st.rerun(scope="app")
 
 
 @st.dialog(title="Delete Product", width="large", on_dismiss=lambda: delete_product_dialog_state(False))
 def delete_product_dialog() -> None:
-    products, product_options = fetch_products()
+    products = fetch_products()
 
     # --- Select the product to delete ---
     selected_index = st.selectbox(
         label="Select Product to Delete",
-        options=list(range(len(product_options))),
-        format_func=lambda i: product_options[i],
+        options=list(range(len(products))),
+        format_func=lambda i: products.options[i],
         placeholder="Select a product to delete",
         accept_new_options=False,
     )
 
     # Get the actual Product object
-    selected_product_obj = products[selected_index]
+    selected_product_obj = products.items[selected_index]
 
     # --- Pre-fill inputs with product data ---
     st.badge(
@@ -188,10 +257,49 @@ def delete_product_dialog() -> None:
     # --- Edit button ---
     if st.button("Delete Product", type="primary", use_container_width=True):
 
-        with st.spinner("Deleting product..."):
-            delete_product_on_notion(selected_product_obj)
-            time.sleep(1)
+        enqueue_product_mutation("delete", selected_product_obj, None,
+                                 f"delete product '{selected_product_obj.name}'")
+        st.toast(f"Produto '{selected_product_obj.name}' será deletado em segundo plano.", icon="⏳")
 
         delete_product_dialog_state(False)
-        st.cache_data.clear()
+        st.rerun(scope="app")
+
+
+@st.dialog(title="Import Products", width="large", on_dismiss=lambda: import_products_dialog_state(False))
+def import_products_dialog() -> None:
+    st.caption("Upload a CSV or JSONL catalog with the columns Name, Price, Category and Print Time. "
+               "Products that already exist (same name) are skipped.")
+    uploaded = st.file_uploader("Catalog file", type=["csv", "jsonl"])
+
+    if uploaded is None:
+        return
+
+    try:
+        rows = read_product_rows(uploaded.name, uploaded.getvalue())
+    except Exception as e:
+        st.error(f"Error reading file: {e}")
+        return
+
+    st.write(f"{len(rows)} products found in the file.")
+    unreadable = sum(1 for row in rows if row["error"])
+    if unreadable:
+        st.warning(f"{unreadable} rows can't be read and will be reported as errors.")
+
+    if st.button("Import Products", type="primary", use_container_width=True):
+        progress = st.progress(0.0, text="Importing products...")
+
+        def on_progress(done: int, total: int) -> None:
+            progress.progress(done / total if total else 1.0, text=f"Imported {done}/{total} products")
+
+        results = pd.DataFrame(import_products(rows, on_progress=on_progress))
+
+        counts = results["Status"].value_counts()
+        col1, col2, col3 = st.columns(3)
+        col1.metric("Created", int(counts.get("created", 0)), border=True)
+        col2.metric("Skipped", int(counts.get("skipped", 0)), border=True)
+        col3.metric("Errors", int(counts.get("error", 0)), border=True)
+        st.dataframe(results, hide_index=True)
+
+    if st.button("Close", use_container_width=True):
+        import_products_dialog_state(False)
         st.rerun(scope="app")
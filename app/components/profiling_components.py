@@ -0,0 +1,27 @@
+import streamlit as st
+
+from core.profiling import Profile
+
+
+def show_profile_overlay(profile: Profile) -> None:
+    """Sidebar summary of a profiled rerun: time per kind of span and the longest spans."""
+    with st.sidebar.expander(f"Profile: {profile.page} ({profile.duration * 1000:.0f} ms)", expanded=True):
+        totals = profile.totals()
+        st.dataframe(
+            [{"Kind": kind, "Spans": t["count"], "ms": t["seconds"] * 1000} for kind, t in sorted(totals.items())],
+            hide_index=True,
+            column_config={"ms": st.column_config.NumberColumn(format="%.1f")},
+        )
+        st.caption("Longest spans (loaders include the API calls and transforms they run):")
+        st.dataframe(
+            profile.top(),
+            hide_index=True,
+            column_config={
+                "Start ms": st.column_config.NumberColumn(format="%.1f"),
+                "ms": st.column_config.NumberColumn(format="%.1f"),
+            },
+        )
+        if profile.dump_path:
+            st.caption(f"Profiler dump saved to `{profile.dump_path}`")
+        for note in profile.notes:
+            st.caption(note)
@@ -0,0 +1,138 @@
+import functools
+import threading
+import time
+from typing import Any, Callable, Dict, List, Tuple
+
+from core.config import get_settings
+from core.rate_limiter import background_priority
+from core.profiling import record_span, span
+
+
+settings = get_settings()
+
+# (loader key, call arguments) -> cached entry, shared by every session of the process
+_entries: Dict[Tuple, "_Entry"] = {}
+# loader key -> bumped on invalidation, so refreshes started before it are discarded
+_generations: Dict[str, int] = {}
+# database name -> cached loaders depending on it, keyed by qualified name so page
+# scripts re-registering their loaders on every rerun don't pile up duplicates
+_loaders: Dict[str, Dict[str, Callable]] = {}
+# database name -> other in-process caches to drop along with the loaders
+_hooks: Dict[str, List[Callable[[], None]]] = {}
+_stats = {"hits": 0, "stale_hits": 0, "misses": 0, "refreshes": 0, "refresh_errors": 0}
+_lock = threading.Lock()
+
+
+class _Entry:
+    __slots__ = ("value", "loaded_at", "refreshing")
+
+    def __init__(self, value: Any) -> None:
+        self.value = value
+        self.loaded_at = time.monotonic()
+        self.refreshing = False
+
+
+def get_ttl(*databases: str) -> int:
+    """TTL of data read from these databases: the shortest configured one."""
+    return min((settings.CACHE_TTL.get(db_name, settings.CACHE_DEFAULT_TTL) for db_name in databases),
+               default=settings.CACHE_DEFAULT_TTL)
+
+
+def _refresh(entry_key: Tuple, generation: int, func: Callable, args: tuple, kwargs: dict) -> None:
+    try:
+        with background_priority():
+            value = func(*args, **kwargs)
+    except Exception as e:
+        print(f"Error refreshing cached {entry_key[0]}:{e}")
+        with _lock:
+            _stats["refresh_errors"] += 1
+            if entry_key in _entries:
+                _entries[entry_key].refreshing = False
+        return
+
+    with _lock:
+        _stats["refreshes"] += 1
+        if _generations.get(entry_key[0], 0) == generation:
+            _entries[entry_key] = _Entry(value)
+
+
+def cached_loader(*databases: str) -> Callable:
+    """
+    Process-wide stale-while-revalidate cache for a loader reading the given
+    Notion databases. Fresh entries are served as is; entries older than the
+    databases' TTL are served immediately while a background thread reloads
+    them. Entries are dropped by `invalidate` for any of those databases.
+    Cached values are shared across sessions and must be treated as read-only.
+    """
+    ttl = get_ttl(*databases)
+
+    def decorator(func: Callable) -> Callable:
+        key = f"{func.__module__}.{func.__qualname__}"
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            entry_key = (key, args, tuple(sorted(kwargs.items())))
+            with _lock:
+                entry = _entries.get(entry_key)
+                generation = _generations.get(key, 0)
+                if entry is None:
+                    _stats["misses"] += 1
+                    record_span("cache miss", func.__qualname__, 0.0)
+                elif time.monotonic() - entry.loaded_at < ttl:
+                    _stats["hits"] += 1
+                    record_span("cache hit", func.__qualname__, 0.0)
+                    return entry.value
+                else:
+                    _stats["stale_hits"] += 1
+                    record_span("cache stale", func.__qualname__, 0.0)
+                    if not entry.refreshing:
+                        entry.refreshing = True
+                        threading.Thread(
+                            target=_refresh, args=(entry_key, generation, func, args, kwargs),
+                            name=f"cache-refresh-{func.__qualname__}", daemon=True
+                        ).start()
+                    return entry.value
+
+            with span("loader", func.__qualname__):
+                value = func(*args, **kwargs)
+            with _lock:
+                if _generations.get(key, 0) == generation:
+                    _entries[entry_key] = _Entry(value)
+            return value
+
+        def clear() -> None:
+            with _lock:
+                _generations[key] = _generations.get(key, 0) + 1
+                for entry_key in [k for k in _entries if k[0] == key]:
+                    del _entries[entry_key]
+
+        wrapper.clear = clear
+        with _lock:
+            for db_name in databases:
+                _loaders.setdefault(db_name, {})[key] = wrapper
+        return wrapper
+
+    return decorator
+
+
+def on_invalidate(db_name: str, callback: Callable[[], None]) -> None:
+    """Run `callback` whenever `db_name` is invalidated."""
+    with _lock:
+        _hooks.setdefault(db_name, []).append(callback)
+
+
+def invalidate(*databases: str) -> None:
+    """Drop the cached data of the loaders (and hooks) tagged with any of these databases."""
+    with _lock:
+        loaders = {key: loader for db_name in databases for key, loader in _loaders.get(db_name, {}).items()}
+        hooks = [hook for db_name in databases for hook in _hooks.get(db_name, [])]
+    for loader in loaders.values():
+        loader.clear()
+    for hook in hooks:
+        hook()
+
+
+def cache_stats() -> Dict[str, int]:
+    """Hit, stale hit, miss and background refresh counters, plus the number of entries."""
+    with _lock:
+        return {**_stats, "entries": len(_entries)}
@@ -1,7 +1,11 @@
 from functools import lru_cache
-from notion_client import Client
+
+import httpx
+from notion_client import Client, AsyncClient
 from pydantic_settings import BaseSettings
 
+from core.rate_limiter import RateLimiter, RateLimitedTransport, AsyncRateLimitedTransport
+
 
 class Settings(BaseSettings):
     """Application configuration, loaded from environment or .env"""
@@ -18,6 +22,31 @@ class Settings(BaseSettings):
     DB_STOCK_ID: str | None = None
     DB_STOCK_MOVEMENT_ID: str | None = None
 
+    # Points the clients at another server, e.g. the local emulator (python -m emulator)
+    NOTION_BASE_URL: str | None = None
+    NOTION_QUERY_LIMIT: int = 10000
+    NOTION_MAX_CONCURRENCY: int = 3
+    NOTION_RATE_LIMIT: float = 3.0
+    NOTION_RATE_BURST: int = 3
+    NOTION_MAX_RETRIES: int = 5
+
+    MIRROR_ENABLED: bool = False
+    MIRROR_PATH: str = ".cache/notion_mirror.sqlite3"
+    MIRROR_SYNC_INTERVAL: int = 60
+    MIRROR_FULL_SYNC_INTERVAL: int = 3600
+
+    MUTATION_MAX_RETRIES: int = 3
+
+    # Per-rerun span timeline in the sidebar (also switchable from the Settings page),
+    # optionally saving a "cprofile" or "pyinstrument" dump of each rerun to PROFILING_DIR
+    PROFILING_ENABLED: bool = False
+    PROFILING_DUMP: str | None = None
+    PROFILING_DIR: str = ".cache/profiles"
+
+    # Seconds before cached data is refreshed in the background, per database name
+    CACHE_DEFAULT_TTL: int = 300
+    CACHE_TTL: dict[str, int] = {}
+
     DEFAULT_TIMEZONE: str = "America/Sao_Paulo"
     DEFAULT_DATE_FORMAT: str = "%d/%m/%Y %H:%M:%S"
 
@@ -40,11 +69,33 @@ def get_settings() -> Settings:
     return Settings()
 
 
+@lru_cache
+def get_rate_limiter() -> RateLimiter:
+    """Process-wide rate limiter shared by every Notion client"""
+    settings = get_settings()
+    return RateLimiter(rate=settings.NOTION_RATE_LIMIT, burst=settings.NOTION_RATE_BURST)
+
+
+def _client_options(settings: Settings) -> dict:
+    options = {"auth": settings.NOTION_API_KEY}
+    if settings.NOTION_BASE_URL:
+        options["base_url"] = settings.NOTION_BASE_URL
+    return options
+
+
 @lru_cache
 def get_notion_client() -> Client:
     """Singleton Notion client"""
     settings = get_settings()
-    return Client(auth=settings.NOTION_API_KEY)
+    transport = RateLimitedTransport(get_rate_limiter(), max_retries=settings.NOTION_MAX_RETRIES)
+    return Client(client=httpx.Client(transport=transport), **_client_options(settings))
+
+
+def get_async_notion_client() -> AsyncClient:
+    """New async Notion client, to be used (and closed) inside a single event loop"""
+    settings = get_settings()
+    transport = AsyncRateLimitedTransport(get_rate_limiter(), max_retries=settings.NOTION_MAX_RETRIES)
+    return AsyncClient(client=httpx.AsyncClient(transport=transport), **_client_options(settings))
 
 
 def get_db_map() -> dict[str, str | None]:
@@ -0,0 +1,172 @@
+import bisect
+import contextvars
+import json
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+
+import httpx
+
+from core.profiling import record_span
+
+# Upper bounds of the latency histogram buckets, in seconds (the last one is +Inf)
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+# Reruns kept for the Settings page
+RERUN_HISTORY = 50
+
+ENDPOINTS: List[Tuple[str, "re.Pattern[str]", str]] = [
+    ("POST", re.compile(r"/v1/databases/(?P<id>[^/]+)/query$"), "databases.query"),
+    ("GET", re.compile(r"/v1/databases/(?P<id>[^/]+)$"), "databases.retrieve"),
+    ("POST", re.compile(r"/v1/pages$"), "pages.create"),
+    ("PATCH", re.compile(r"/v1/pages/[^/]+$"), "pages.update"),
+    ("GET", re.compile(r"/v1/pages/[^/]+$"), "pages.retrieve"),
+    ("POST", re.compile(r"/v1/search$"), "search"),
+]
+
+
+class _Series:
+    __slots__ = ("statuses", "buckets", "total_seconds")
+
+    def __init__(self) -> None:
+        self.statuses: Dict[str, int] = {}
+        self.buckets = [0] * (len(LATENCY_BUCKETS) + 1)
+        self.total_seconds = 0.0
+
+
+# (endpoint, database name) -> counters, for the whole process
+_series: Dict[Tuple[str, str], _Series] = {}
+_reruns: Deque[dict] = deque(maxlen=RERUN_HISTORY)
+_lock = threading.Lock()
+
+# Calls of the current rerun; prefetch threads run in copies of the context, so they count too
+_rerun_calls: contextvars.ContextVar[Optional[Dict[str, int]]] = contextvars.ContextVar("notion_rerun_calls", default=None)
+
+
+def _database_name(database_id: Optional[str]) -> str:
+    if not database_id:
+        return ""
+    from core.config import get_db_map
+
+    key = database_id.replace("-", "")
+    return next((name for name, db_id in get_db_map().items() if db_id and db_id.replace("-", "") == key), key)
+
+
+def classify(request: httpx.Request) -> Tuple[str, str]:
+    """Endpoint name (e.g. "databases.query") and database name of a Notion API request."""
+    for method, pattern, endpoint in ENDPOINTS:
+        match = pattern.search(request.url.path)
+        if request.method == method and match:
+            database_id = match.groupdict().get("id")
+            if endpoint == "pages.create":
+                try:
+                    database_id = json.loads(request.content or b"{}").get("parent", {}).get("database_id")
+                except ValueError:
+                    database_id = None
+            return endpoint, _database_name(database_id)
+    return "other", ""
+
+
+def record(request: httpx.Request, status: str, seconds: float) -> None:
+    """Count one HTTP attempt: its status code (or "error" if it raised) and its latency."""
+    key = classify(request)
+    record_span("api", " ".join(filter(None, key)), seconds)
+    with _lock:
+        series = _series.get(key)
+        if series is None:
+            series = _series[key] = _Series()
+        series.statuses[status] = series.statuses.get(status, 0) + 1
+        series.buckets[bisect.bisect_left(LATENCY_BUCKETS, seconds)] += 1
+        series.total_seconds += seconds
+        calls = _rerun_calls.get()
+        if calls is not None:
+            calls[key[0]] = calls.get(key[0], 0) + 1
+
+
+@contextmanager
+def track_rerun(page: str) -> Iterator[Dict[str, int]]:
+    """Count the Notion calls made while rendering a page, and keep them in the rerun history."""
+    calls: Dict[str, int] = {}
+    token = _rerun_calls.set(calls)
+    started = time.perf_counter()
+    try:
+        yield calls
+    finally:
+        _rerun_calls.reset(token)
+        with _lock:
+            _reruns.appendleft({
+                "Page": page,
+                "Calls": sum(calls.values()),
+                **calls,
+                "Seconds": round(time.perf_counter() - started, 3),
+            })
+
+
+def recent_reruns() -> List[dict]:
+    with _lock:
+        return list(_reruns)
+
+
+def _quantile(buckets: List[int], q: float) -> Optional[float]:
+    """Upper bound of the histogram bucket holding the `q` quantile (None in the +Inf bucket)."""
+    total = sum(buckets)
+    if not total:
+        return None
+    seen = 0
+    for bound, count in zip(LATENCY_BUCKETS + (None,), buckets):
+        seen += count
+        if seen >= q * total:
+            return bound
+    return None
+
+
+def call_summary() -> List[dict]:
+    """One row per endpoint and database: calls, error and 429 rates, mean and approximate p95 latency."""
+    with _lock:
+        items = [(key, dict(s.statuses), list(s.buckets), s.total_seconds) for key, s in _series.items()]
+    rows = []
+    for (endpoint, database), statuses, buckets, total_seconds in sorted(items):
+        calls = sum(statuses.values())
+        errors = sum(n for status, n in statuses.items() if not status.startswith("2"))
+        p95 = _quantile(buckets, 0.95)
+        rows.append({
+            "Endpoint": endpoint,
+            "Database": database,
+            "Calls": calls,
+            "Error rate": errors / calls,
+            "429 rate": statuses.get("429", 0) / calls,
+            "Mean ms": total_seconds / calls * 1000,
+            "p95 ms ≤": p95 * 1000 if p95 is not None else None,
+        })
+    return rows
+
+
+def prometheus_text() -> str:
+    """All counters in the Prometheus text exposition format."""
+    with _lock:
+        items = sorted((key, dict(s.statuses), list(s.buckets), s.total_seconds) for key, s in _series.items())
+
+    lines = [
+        "# HELP notion_requests_total Notion API requests by endpoint, database and status.",
+        "# TYPE notion_requests_total counter",
+    ]
+    for (endpoint, database), statuses, _, _ in items:
+        for status, count in sorted(statuses.items()):
+            lines.append(f'notion_requests_total{{endpoint="{endpoint}",database="{database}",status="{status}"}} {count}')
+
+    lines += [
+        "# HELP notion_request_duration_seconds Latency of Notion API requests.",
+        "# TYPE notion_request_duration_seconds histogram",
+    ]
+    for (endpoint, database), statuses, buckets, total_seconds in items:
+        labels = f'endpoint="{endpoint}",database="{database}"'
+        cumulative = 0
+        for bound, count in zip(LATENCY_BUCKETS + (None,), buckets):
+            cumulative += count
+            le = "+Inf" if bound is None else f"{bound:g}"
+            lines.append(f'notion_request_duration_seconds_bucket{{{labels},le="{le}"}} {cumulative}')
+        lines.append(f"notion_request_duration_seconds_sum{{{labels}}} {total_seconds:.6f}")
+        lines.append(f"notion_request_duration_seconds_count{{{labels}}} {cumulative}")
+    return "\n".join(lines) + "\n"
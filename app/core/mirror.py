@@ -0,0 +1,138 @@
+import json
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Iterable, Iterator, Optional
+
+from core.config import get_settings
+
+
+settings = get_settings()
+
+_lock = threading.Lock()
+_connection: Optional[sqlite3.Connection] = None
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS pages (
+    database_id TEXT NOT NULL,
+    page_id TEXT NOT NULL,
+    last_edited_time TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    PRIMARY KEY (database_id, page_id)
+);
+CREATE TABLE IF NOT EXISTS sync_state (
+    database_id TEXT PRIMARY KEY,
+    checkpoint TEXT,
+    synced_at REAL,
+    full_synced_at REAL
+);
+"""
+
+
+def _key(database_id: str) -> str:
+    """Normalize a Notion ID, which may come with or without dashes."""
+    return database_id.replace("-", "")
+
+
+def _connect() -> sqlite3.Connection:
+    """Shared connection to the local mirror, created on first use."""
+    global _connection
+    if _connection is None:
+        path = Path(settings.MIRROR_PATH)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        _connection = sqlite3.connect(path, check_same_thread=False)
+        _connection.execute("PRAGMA journal_mode=WAL")
+        _connection.executescript(SCHEMA)
+    return _connection
+
+
+def is_enabled() -> bool:
+    return settings.MIRROR_ENABLED
+
+
+def get_sync_state(database_id: str) -> Optional[dict]:
+    """Return the last checkpoint and sync times of a database, or None if never synced."""
+    with _lock:
+        row = _connect().execute(
+            "SELECT checkpoint, synced_at, full_synced_at FROM sync_state WHERE database_id = ?",
+            (_key(database_id),)
+        ).fetchone()
+    if row is None:
+        return None
+    return {"checkpoint": row[0], "synced_at": row[1], "full_synced_at": row[2]}
+
+
+def save_sync_state(database_id: str, checkpoint: Optional[str], synced_at: float, full: bool = False) -> None:
+    with _lock, _connect() as conn:
+        conn.execute(
+            """
+            INSERT INTO sync_state (database_id, checkpoint, synced_at, full_synced_at)
+            VALUES (?, ?, ?, ?)
+            ON CONFLICT (database_id) DO UPDATE SET
+                checkpoint = excluded.checkpoint,
+                synced_at = excluded.synced_at,
+                full_synced_at = COALESCE(excluded.full_synced_at, sync_state.full_synced_at)
+            """,
+            (_key(database_id), checkpoint, synced_at, synced_at if full else None)
+        )
+
+
+def upsert_pages(database_id: str, pages: Iterable[dict]) -> Optional[str]:
+    """Store pages in the mirror and return the newest `last_edited_time` among them."""
+    rows = [(_key(database_id), p["id"], p.get("last_edited_time", ""), json.dumps(p)) for p in pages]
+    if not rows:
+        return None
+    with _lock, _connect() as conn:
+        conn.executemany(
+            "INSERT OR REPLACE INTO pages (database_id, page_id, last_edited_time, payload) VALUES (?, ?, ?, ?)",
+            rows
+        )
+    return max(r[2] for r in rows)
+
+
+def replace_pages(database_id: str, pages: Iterable[dict]) -> Optional[str]:
+    """Replace every mirrored page of a database, dropping pages that no longer exist."""
+    rows = [(_key(database_id), p["id"], p.get("last_edited_time", ""), json.dumps(p)) for p in pages]
+    with _lock, _connect() as conn:
+        conn.execute("DELETE FROM pages WHERE database_id = ?", (_key(database_id),))
+        conn.executemany(
+            "INSERT INTO pages (database_id, page_id, last_edited_time, payload) VALUES (?, ?, ?, ?)",
+            rows
+        )
+    return max((r[2] for r in rows), default=None)
+
+
+def remove_page(page_id: str) -> None:
+    with _lock, _connect() as conn:
+        conn.execute("DELETE FROM pages WHERE page_id = ?", (page_id,))
+
+
+def read_pages(database_id: str) -> Iterator[dict]:
+    """Yield the mirrored pages of a database, most recently edited first."""
+    with _lock:
+        rows = _connect().execute(
+            "SELECT payload FROM pages WHERE database_id = ? ORDER BY last_edited_time DESC",
+            (_key(database_id),)
+        ).fetchall()
+    for (payload,) in rows:
+        yield json.loads(payload)
+
+
+def count_pages(database_id: str) -> int:
+    with _lock:
+        (count,) = _connect().execute(
+            "SELECT COUNT(*) FROM pages WHERE database_id = ?", (_key(database_id),)
+        ).fetchone()
+    return count
+
+
+def record_page(page: Optional[dict]) -> None:
+    """Mirror a page returned by one of our own create/update calls."""
+    if not is_enabled() or not page:
+        return
+    if page.get("archived") or page.get("in_trash"):
+        remove_page(page["id"])
+        return
+    database_id = page.get("parent", {}).get("database_id")
+    if database_id:
+        upsert_pages(database_id, [page])
@@ -0,0 +1,151 @@
+import contextvars
+import cProfile
+import re
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional
+
+
+class Profile:
+    """Timeline of the spans recorded during one rerun of a page."""
+
+    __slots__ = ("page", "started", "duration", "spans", "dump_path", "notes", "_lock")
+
+    def __init__(self, page: str) -> None:
+        self.page = page
+        self.started = time.perf_counter()
+        self.duration = 0.0
+        # (kind, name, start offset, seconds)
+        self.spans: List[tuple] = []
+        self.dump_path: Optional[str] = None
+        self.notes: List[str] = []
+        self._lock = threading.Lock()
+
+    def add(self, kind: str, name: str, started: float, seconds: float) -> None:
+        with self._lock:
+            self.spans.append((kind, name, started - self.started, seconds))
+
+    def top(self, n: int = 15) -> List[dict]:
+        """The `n` longest spans, longest first."""
+        with self._lock:
+            spans = sorted(self.spans, key=lambda s: s[3], reverse=True)[:n]
+        return [{"Kind": k, "Span": name, "Start ms": start * 1000, "ms": seconds * 1000}
+                for k, name, start, seconds in spans]
+
+    def totals(self) -> Dict[str, dict]:
+        """Count and total seconds per kind of span."""
+        totals: Dict[str, dict] = {}
+        with self._lock:
+            for kind, _, _, seconds in self.spans:
+                total = totals.setdefault(kind, {"count": 0, "seconds": 0.0})
+                total["count"] += 1
+                total["seconds"] += seconds
+        return totals
+
+
+# Only one cProfile/pyinstrument profiler can run per process, so concurrent reruns share it
+_dump_lock = threading.Lock()
+
+# The profile of the current rerun; prefetch threads run in copies of the context, so they record into it too
+_profile: contextvars.ContextVar[Optional[Profile]] = contextvars.ContextVar("rerun_profile", default=None)
+
+
+@contextmanager
+def span(kind: str, name: str) -> Iterator[None]:
+    """Time a block (kind: loader, api, transform, render...) when the rerun is being profiled."""
+    profile = _profile.get()
+    if profile is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.add(kind, name, started, time.perf_counter() - started)
+
+
+def record_span(kind: str, name: str, seconds: float) -> None:
+    """Add a span that was timed elsewhere (e.g. an API call) and just ended."""
+    profile = _profile.get()
+    if profile is not None:
+        profile.add(kind, name, time.perf_counter() - seconds, seconds)
+
+
+def _start_dump(dump: Optional[str], profile: Profile):
+    """Start the profiler of a dump, holding `_dump_lock` until `_save_dump` (None if no dump is taken)."""
+    if dump == "pyinstrument":
+        try:
+            from pyinstrument import Profiler
+        except ImportError:
+            profile.notes.append("pyinstrument is not installed; no dump was saved.")
+            return None
+    elif dump != "cprofile":
+        return None
+
+    if not _dump_lock.acquire(blocking=False):
+        profile.notes.append("Another rerun is being dumped; no dump was saved for this one.")
+        return None
+    try:
+        if dump == "cprofile":
+            profiler = cProfile.Profile()
+            profiler.enable()
+        else:
+            profiler = Profiler()
+            profiler.start()
+        return profiler
+    except Exception as e:
+        # e.g. a profiler started outside the app is already active
+        _dump_lock.release()
+        profile.notes.append(f"Could not start the {dump} profiler: {e}")
+        return None
+
+
+def _save_dump(profiler, directory: str, profile: Profile) -> None:
+    """Stop the profiler, release `_dump_lock` and write the dump."""
+    try:
+        if isinstance(profiler, cProfile.Profile):
+            profiler.disable()
+        else:
+            profiler.stop()
+    finally:
+        _dump_lock.release()
+
+    stem = f"{datetime.now():%Y%m%d-%H%M%S}-{re.sub(r'[^A-Za-z0-9]+', '_', profile.page).strip('_') or 'page'}"
+    try:
+        Path(directory).mkdir(parents=True, exist_ok=True)
+        if isinstance(profiler, cProfile.Profile):
+            path = Path(directory) / f"{stem}.prof"
+            profiler.dump_stats(path)
+        else:
+            path = Path(directory) / f"{stem}.html"
+            path.write_text(profiler.output_html(), encoding="utf-8")
+        profile.dump_path = str(path)
+    except OSError as e:
+        profile.notes.append(f"Could not save the dump: {e}")
+
+
+@contextmanager
+def profile_rerun(page: str, enabled: bool, dump: Optional[str] = None,
+                  directory: str = ".cache/profiles") -> Iterator[Optional[Profile]]:
+    """
+    Record the spans of one rerun when `enabled` (yields None otherwise), and
+    optionally save a "cprofile" (.prof) or "pyinstrument" (.html) dump of it.
+    """
+    if not enabled:
+        yield None
+        return
+
+    profile = Profile(page)
+    token = _profile.set(profile)
+    profiler = None
+    try:
+        profiler = _start_dump(dump, profile)
+        yield profile
+    finally:
+        profile.duration = time.perf_counter() - profile.started
+        _profile.reset(token)
+        if profiler is not None:
+            _save_dump(profiler, directory, profile)
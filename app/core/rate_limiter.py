@@ -0,0 +1,157 @@
+import asyncio
+import contextvars
+import heapq
+import itertools
+import random
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator, List, Optional, Tuple
+
+import httpx
+
+from core import metrics
+
+
+# Lower value = served first
+PRIORITY_WRITE = 0
+PRIORITY_READ = 1
+PRIORITY_BACKGROUND = 2
+
+_background = contextvars.ContextVar("notion_background_priority", default=False)
+
+
+@contextmanager
+def background_priority() -> Iterator[None]:
+    """Run the Notion reads issued inside this block behind interactive ones."""
+    token = _background.set(True)
+    try:
+        yield
+    finally:
+        _background.reset(token)
+
+
+def request_priority(request: httpx.Request) -> int:
+    """Writes (page create/update) go first, then interactive reads, then background reads."""
+    if request.method in ("PATCH", "DELETE") or (request.method == "POST" and request.url.path.endswith("/pages")):
+        return PRIORITY_WRITE
+    return PRIORITY_BACKGROUND if _background.get() else PRIORITY_READ
+
+
+class RateLimiter:
+    """Token bucket shared by every Notion call, granting tokens by priority."""
+
+    def __init__(self, rate: float, burst: int) -> None:
+        self.rate = rate
+        self.burst = burst
+        self.throttled = 0
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._waiters: List[Tuple[int, int]] = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of calls currently waiting for a token."""
+        return len(self._waiters)
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def acquire(self, priority: int = PRIORITY_READ) -> None:
+        """Block until this call may be sent."""
+        with self._cond:
+            ticket = (priority, next(self._seq))
+            heapq.heappush(self._waiters, ticket)
+            try:
+                while True:
+                    now = time.monotonic()
+                    self._refill(now)
+                    timeout: Optional[float] = None
+                    if self._waiters[0] == ticket:
+                        if now >= self._paused_until and self._tokens >= 1:
+                            self._tokens -= 1
+                            heapq.heappop(self._waiters)
+                            self._cond.notify_all()
+                            return
+                        timeout = max(self._paused_until - now, (1 - self._tokens) / self.rate)
+                    self._cond.wait(timeout)
+            except BaseException:
+                self._waiters.remove(ticket)
+                heapq.heapify(self._waiters)
+                self._cond.notify_all()
+                raise
+
+    def pause(self, seconds: float) -> None:
+        """Stop granting tokens for `seconds`, e.g. after a 429 response."""
+        with self._cond:
+            self.throttled += 1
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0
+            self._cond.notify_all()
+
+
+def retry_delay(response: httpx.Response, attempt: int) -> float:
+    """Honor `Retry-After` when present, otherwise back off exponentially; both jittered."""
+    try:
+        delay = float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        delay = min(0.5 * 2 ** attempt, 30.0)
+    return delay + random.uniform(0, delay * 0.25 + 0.1)
+
+
+class RateLimitedTransport(httpx.HTTPTransport):
+    """Sync transport routing every request through the shared rate limiter."""
+
+    def __init__(self, limiter: RateLimiter, max_retries: int = 5, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.limiter = limiter
+        self.max_retries = max_retries
+
+    def handle_request(self, request: httpx.Request) -> httpx.Response:
+        priority = request_priority(request)
+        for attempt in range(self.max_retries + 1):
+            self.limiter.acquire(priority)
+            started = time.perf_counter()
+            try:
+                response = super().handle_request(request)
+            except Exception:
+                metrics.record(request, "error", time.perf_counter() - started)
+                raise
+            metrics.record(request, str(response.status_code), time.perf_counter() - started)
+            if response.status_code != 429 or attempt == self.max_retries:
+                return response
+            response.read()
+            response.close()
+            self.limiter.pause(retry_delay(response, attempt))
+        return response
+
+
+class AsyncRateLimitedTransport(httpx.AsyncHTTPTransport):
+    """Async transport sharing the same rate limiter as the sync one."""
+
+    def __init__(self, limiter: RateLimiter, max_retries: int = 5, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.limiter = limiter
+        self.max_retries = max_retries
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        priority = request_priority(request)
+        for attempt in range(self.max_retries + 1):
+            await asyncio.to_thread(self.limiter.acquire, priority)
+            started = time.perf_counter()
+            try:
+                response = await super().handle_async_request(request)
+            except Exception:
+                metrics.record(request, "error", time.perf_counter() - started)
+                raise
+            metrics.record(request, str(response.status_code), time.perf_counter() - started)
+            if response.status_code != 429 or attempt == self.max_retries:
+                return response
+            await response.aread()
+            await response.aclose()
+            self.limiter.pause(retry_delay(response, attempt))
+        return response
@@ -1,8 +1,18 @@
 import streamlit as st
 
+from core.config import get_settings
+from core.metrics import track_rerun
+from core.profiling import profile_rerun
+from components.profiling_components import show_profile_overlay
+from services.notion_service import start_mirror_sync
+
 # Main page configs
 st.logo('./app/image/jmake-logo.svg', size='medium')
 
+# Keep the local Notion mirror fresh in the background
+if get_settings().MIRROR_ENABLED:
+    start_mirror_sync()
+
 # Navigation pages
 pages = {
     "Home": [st.Page("pages/home.py", title="Home", default=True)],
@@ -11,4 +21,11 @@ pages = {
 }
 
 nav = st.navigation(pages, position="top")
-nav.run()
+settings = get_settings()
+# Count the Notion calls each rerun makes (see Settings), and time its spans when profiling
+profiling = settings.PROFILING_ENABLED or st.session_state.get("profiling", False)
+with track_rerun(nav.title), profile_rerun(nav.title, profiling, settings.PROFILING_DUMP, settings.PROFILING_DIR) as profile:
+    nav.run()
+
+if profile is not None:
+    show_profile_overlay(profile)
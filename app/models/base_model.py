@@ -0,0 +1,104 @@
+from typing import Dict, Iterable, List, Optional, Tuple, Type, TypeVar
+
+import pandas as pd
+
+from core.profiling import span
+from utils.notion_utils import PropertyExtractor, extract_properties, get_extractor, localize_datetime_columns
+
+M = TypeVar("M", bound="NotionModel")
+
+
+class NotionModel:
+    """Base class of the models backed by a Notion database"""
+
+    # Subclasses list their fields in __slots__; the database ID is a class constant
+    __slots__ = ()
+
+    database_id: Optional[str] = None
+
+    # DataFrame column -> Notion property name, in `to_dict` order (after DatabaseId/NotionID)
+    FRAME_COLUMNS: Dict[str, str] = {}
+    # Numeric DataFrame columns -> dtype
+    FRAME_DTYPES: Dict[str, str] = {}
+    DATETIME_COLUMNS = ("Created Time", "Last Edited Time")
+    # Notion properties in the order of the __init__ parameters, whose last one is
+    # notion_id (the page ID), so instances are built positionally from extractor rows
+    ROW_PROPERTIES: Tuple[str, ...] = ()
+
+    @classmethod
+    def frame_columns(cls) -> List[str]:
+        return ["DatabaseId", "NotionID", *cls.FRAME_COLUMNS]
+
+    @classmethod
+    def properties(cls, columns: Optional[Iterable[str]] = None) -> Tuple[str, ...]:
+        """Notion properties behind the given frame columns (all of them by default), to fetch only those."""
+        return tuple(cls.FRAME_COLUMNS[column] for column in (cls.FRAME_COLUMNS if columns is None else columns))
+
+    @classmethod
+    def extract_props(cls, page: dict) -> dict:
+        """Extract only the properties this model reads from a Notion page."""
+        return extract_properties(page, cls.FRAME_COLUMNS.values())
+
+    @classmethod
+    def row_extractor(cls, page: dict) -> PropertyExtractor:
+        """Compiled extractor returning the `ROW_PROPERTIES` of pages shaped like `page`, in order."""
+        properties = page.get("properties", {})
+        return get_extractor(tuple((name, (properties.get(name) or {}).get("type")) for name in cls.ROW_PROPERTIES))
+
+    @classmethod
+    def from_dict(cls: Type[M], page: dict) -> M:
+        """Build an instance from a Notion page; properties missing from the page are None."""
+        return cls(*cls.row_extractor(page).extract(page), page.get("id"))
+
+    @classmethod
+    def from_pages(cls: Type[M], pages: Iterable[dict]) -> List[M]:
+        """
+        Build one instance per page of a database, compiling the extractor once
+        and passing each extracted row to the constructor positionally.
+        """
+        if not cls.ROW_PROPERTIES:
+            return [cls.from_dict(page) for page in pages]
+        instances: List[M] = []
+        extract = None
+        for page in pages:
+            if extract is None:
+                extract = cls.row_extractor(page).extract
+            instances.append(cls(*extract(page), page.get("id")))
+        return instances
+
+    @classmethod
+    def frame_from_pages(cls, pages: Iterable[dict]) -> pd.DataFrame:
+        with span("transform", f"{cls.__name__}.frame_from_pages"):
+            return cls._frame_from_pages(pages)
+
+    @classmethod
+    def _frame_from_pages(cls, pages: Iterable[dict]) -> pd.DataFrame:
+        """
+        Build a DataFrame shaped like `to_dict()` straight from Notion pages, filling
+        column arrays in a single pass instead of creating one object per row.
+        Columns whose property wasn't fetched (sparse queries) are left empty.
+        """
+        notion_ids: List[str] = []
+        columns: List[list] = [[] for _ in cls.FRAME_COLUMNS]
+        extractor, positions = None, []
+
+        for page in pages:
+            if extractor is None:
+                extractor = PropertyExtractor.from_page(page)
+                positions = [
+                    extractor.names.index(prop) if prop in extractor.names else None
+                    for prop in cls.FRAME_COLUMNS.values()
+                ]
+            row = extractor.extract(page)
+            notion_ids.append(page.get("id"))
+            for values, position in zip(columns, positions):
+                values.append(None if position is None else row[position])
+
+        df = pd.DataFrame({
+            "DatabaseId": pd.Series([cls.database_id] * len(notion_ids), dtype=object),
+            "NotionID": pd.Series(notion_ids, dtype=object),
+            **{column: pd.Series(values, dtype=object) for column, values in zip(cls.FRAME_COLUMNS, columns)},
+        })
+        for column, dtype in cls.FRAME_DTYPES.items():
+            df[column] = pd.to_numeric(df[column], errors="coerce").astype(dtype)
+        return localize_datetime_columns(df, cls.DATETIME_COLUMNS)
@@ -1,15 +1,27 @@
 import json
 from datetime import datetime
-from typing import Optional, Dict
+from typing import Optional
 
-from utils.notion_utils import extract_properties_to_easy_dict
 from core.config import get_settings
+from models.base_model import NotionModel
 
 settings = get_settings()
 
-class Category:
+class Category(NotionModel):
     """Category class representation"""
 
+    __slots__ = ("category_id", "name", "created_time", "last_edited_time", "notion_id")
+
+    database_id = settings.DB_CATEGORY_ID
+
+    FRAME_COLUMNS = {
+        "ID": "ID",
+        "Name": "Name",
+        "Created Time": "Created time",
+        "Last Edited Time": "Last edited time",
+    }
+    ROW_PROPERTIES = ("Name", "ID", "Created time", "Last edited time")
+
     def __init__(self,
                  name: str,
                  category_id: Optional[str] = None,
@@ -17,7 +29,6 @@ class Category:
                  last_edited_time: Optional[datetime] = None,
                  notion_id: Optional[str] = None) -> None:
 
-        self.database_id = settings.DB_CATEGORY_ID
         self.category_id = category_id
         self.name = name
         self.created_time = created_time
@@ -39,18 +50,6 @@ class Category:
         category_as_dict = json.loads(category_as_json)
         return cls.from_dict(category_as_dict)
 
-    @classmethod
-    def from_dict(cls, category_as_dict: Dict) -> 'Category':
-        props = extract_properties_to_easy_dict(category_as_dict)
-
-        return cls(
-            notion_id=category_as_dict.get('id'),
-            category_id=props.get('ID'),
-            name=props.get('Name'),
-            created_time=props.get('Created time'),
-            last_edited_time=props.get('Last edited time')
-        )
-
     def get_parent(self) -> dict:
         return {
             "type": "database_id",
@@ -1,17 +1,42 @@
 import json
 from datetime import datetime
-from typing import Optional, Dict, List
+from typing import Optional, List
 
-from utils.notion_utils import extract_properties_to_easy_dict
 from core.config import get_settings
+from models.base_model import NotionModel
 
 
 settings = get_settings()
 
 
-class Customer:
+class Customer(NotionModel):
     """Customer class representation"""
 
+    __slots__ = (
+        "customer_id", "name", "order", "phone", "address", "country", "email", "description",
+        "gender", "created_time", "last_edited_time", "notion_id"
+    )
+
+    database_id = settings.DB_CUSTOMER_ID
+
+    FRAME_COLUMNS = {
+        "ID": "ID",
+        "Name": "Name",
+        "Order": "Order",
+        "Phone": "Phone",
+        "Address": "Address",
+        "Country": "Country",
+        "Email": "Email",
+        "Description": "Description",
+        "Gender": "Gender",
+        "Created Time": "Created time",
+        "Last Edited Time": "Last edited time",
+    }
+    ROW_PROPERTIES = (
+        "ID", "Name", "Order", "Phone", "Address", "Country", "Email", "Description", "Gender",
+        "Created time", "Last edited time",
+    )
+
     def __init__(self,
                  customer_id: str,
                  name: str,
@@ -26,7 +51,6 @@ class Customer:
                  last_edited_time: datetime,
                  notion_id: Optional[str] = None) -> None:
 
-        self.database_id = settings.DB_CUSTOMER_ID
         self.customer_id = customer_id
         self.name = name
         self.order = order
@@ -62,25 +86,6 @@ class Customer:
         customer_as_dict = json.loads(customer_as_json)
         return cls.from_dict(customer_as_dict)
 
-    @classmethod
-    def from_dict(cls, customer_as_dict: Dict) -> 'Customer':
-        props = extract_properties_to_easy_dict(customer_as_dict)
-
-        return cls(
-            notion_id=customer_as_dict.get('id'),
-            customer_id=props.get('ID'),
-            name=props.get('Name'),
-            order=props.get('Order', []),
-            phone=props.get('Phone'),
-            address=props.get('Address'),
-            country=props.get('Country'),
-            email=props.get('Email'),
-            description=props.get('Description'),
-            gender=props.get('Gender'),
-            created_time=props.get('Created time'),
-            last_edited_time=props.get('Last edited time')
-        )
-
     async def get_parent(self) -> dict:
         return {
             "type": "database_id",
@@ -2,16 +2,37 @@ import json
 from datetime import datetime
 from typing import Optional, Dict, List
 
-from utils.notion_utils import extract_properties_to_easy_dict
 from core.config import get_settings
+from models.base_model import NotionModel
 
 
 settings = get_settings()
 
 
-class OrderItem:
+class OrderItem(NotionModel):
     """Order Item class representation"""
 
+    __slots__ = (
+        "order_item_id", "name", "sale_ids", "product_ids", "quantity", "price", "suggested_price",
+        "total_value", "created_time", "last_edited_time", "notion_id"
+    )
+
+    database_id = settings.DB_ORDER_ITEM_ID
+
+    FRAME_COLUMNS = {
+        "ID": "ID",
+        "Name": "Name",
+        "Sale": "Sale",
+        "Product": "Product",
+        "Quantity": "Quantity",
+        "Price": "Price",
+        "Suggested Price": "Suggested Price",
+        "Total Value": "Total Value",
+        "Created Time": "Created time",
+        "Last Edited Time": "Last edited time",
+    }
+    FRAME_DTYPES = {"Quantity": "float64", "Price": "float64", "Suggested Price": "float64", "Total Value": "float64"}
+
     def __init__(self,
                  order_item_id: str,
                  name: str,
@@ -25,7 +46,6 @@ class OrderItem:
                  last_edited_time: datetime,
                  notion_id: Optional[str] = None) -> None:
 
-        self.database_id = settings.DB_ORDER_ITEM_ID
         self.order_item_id = order_item_id
         self.name = name
         self.sale_ids = sale_ids
@@ -61,7 +81,7 @@ class OrderItem:
 
     @classmethod
     def from_dict(cls, order_item_as_dict: Dict) -> 'OrderItem':
-        props = extract_properties_to_easy_dict(order_item_as_dict)
+        props = cls.extract_props(order_item_as_dict)
 
         suggested_price = None
         sp_rollup = order_item_as_dict.get('properties', {}).get('Suggested Price', {})
@@ -1,17 +1,42 @@
 import json
 from datetime import datetime, date
-from typing import Optional, Dict, List
+from typing import Optional, List
 
-from utils.notion_utils import extract_properties_to_easy_dict
 from core.config import get_settings
+from models.base_model import NotionModel
 
 
 settings = get_settings()
 
 
-class Order:
+class Order(NotionModel):
     """Order class representation"""
 
+    __slots__ = (
+        "order_id", "name", "order_date", "store_ids", "customer_ids", "sale_item_ids",
+        "total_value", "description", "created_time", "last_edited_time", "notion_id"
+    )
+
+    database_id = settings.DB_ORDER_ID
+
+    FRAME_COLUMNS = {
+        "ID": "ID",
+        "Name": "Name",
+        "Date": "Date",
+        "Store": "Store",
+        "Customer": "Customer",
+        "Sale Item": "Sale Item",
+        "Total Value": "Total Value",
+        "Description": "Description",
+        "Created Time": "Created time",
+        "Last Edited Time": "Last edited time",
+    }
+    FRAME_DTYPES = {"Total Value": "float64"}
+    ROW_PROPERTIES = (
+        "Name", "ID", "Date", "Store", "Customer", "Sale Item", "Total Value", "Description",
+        "Created time", "Last edited time",
+    )
+
     def __init__(self,
                  name: str,
                  order_id: Optional[str] = None,
@@ -25,7 +50,6 @@ class Order:
                  last_edited_time: Optional[datetime] = None,
                  notion_id: Optional[str] = None) -> None:
 
-        self.database_id = settings.DB_ORDER_ID
         self.order_id = order_id
         self.name = name
         self.order_date = order_date
@@ -59,24 +83,6 @@ class Order:
         order_as_dict = json.loads(order_as_json)
         return cls.from_dict(order_as_dict)
 
-    @classmethod
-    def from_dict(cls, order_as_dict: Dict) -> 'Order':
-        props = extract_properties_to_easy_dict(order_as_dict)
-
-        return cls(
-            notion_id=order_as_dict.get('id'),
-            order_id=props.get('ID'),
-            name=props.get('Name'),
-            order_date=props.get('Date'),
-            store_ids=props.get('Store', []),
-            customer_ids=props.get('Customer', []),
-            sale_item_ids=props.get('Sale Item', []),
-            total_value=props.get('Total Value'),
-            description=props.get('Description'),
-            created_time=props.get('Created time'),
-            last_edited_time=props.get('Last edited time')
-        )
-
     async def get_parent(self) -> dict:
         return {
             "type": "database_id",
@@ -1,19 +1,42 @@
 import json
 from datetime import datetime
-from typing import Optional, Dict, List
+from typing import Optional, List
 
 import pandas as pd
 
-from utils.notion_utils import extract_properties_to_easy_dict
 from core.config import get_settings
+from models.base_model import NotionModel
 
 
 settings = get_settings()
 
 
-class Product:
+class Product(NotionModel):
     """Product class representation"""
 
+    __slots__ = (
+        "product_id", "name", "price", "stock", "category", "stock_qty", "print_time",
+        "created_time", "last_edited_time", "notion_id"
+    )
+
+    database_id = settings.DB_PRODUCT_ID
+
+    FRAME_COLUMNS = {
+        "ID": "ID",
+        "Name": "Name",
+        "Price": "Price",
+        "Stock": "Stock",
+        "Category": "Category",
+        "Stock Qty": "Stock Qty",
+        "Print Time": "Print Time",
+        "Created Time": "Created time",
+        "Last Edited Time": "Last edited time",
+    }
+    FRAME_DTYPES = {"Price": "float64", "Stock Qty": "float64", "Print Time": "float64"}
+    ROW_PROPERTIES = (
+        "Name", "ID", "Price", "Stock", "Category", "Stock Qty", "Print Time", "Created time", "Last edited time"
+    )
+
     def __init__(self,
                  name: str,
                  product_id: Optional[str] = None,
@@ -26,7 +49,6 @@ class Product:
                  last_edited_time: Optional[datetime] = None,
                  notion_id: Optional[str] = None) -> None:
 
-        self.database_id = settings.DB_PRODUCT_ID
         self.product_id = product_id
         self.name = name
         self.price = price
@@ -58,23 +80,6 @@ class Product:
         product_as_dict = json.loads(product_as_json)
         return cls.from_dict(product_as_dict)
 
-    @classmethod
-    def from_dict(cls, product_as_dict: Dict) -> 'Product':
-        props = extract_properties_to_easy_dict(product_as_dict)
-
-        return cls(
-            notion_id=product_as_dict.get('id'),
-            product_id=props.get('ID'),
-            name=props.get('Name'),
-            price=props.get('Price'),
-            stock=props.get('Stock', []),
-            category=props.get('Category', []),
-            stock_qty=props.get('Stock Qty'),
-            print_time=props.get('Print Time'),
-            created_time=props.get('Created time'),
-            last_edited_time=props.get('Last edited time')
-        )
-
     def get_parent(self) -> dict:
         return {
             "type": "database_id",
@@ -1,17 +1,39 @@
 import json
 from datetime import datetime
-from typing import Optional, Dict, List
+from typing import Optional, List
 
-from utils.notion_utils import extract_properties_to_easy_dict
 from core.config import get_settings
+from models.base_model import NotionModel
 
 
 settings = get_settings()
 
 
-class StockMovement:
+class StockMovement(NotionModel):
     """Stock Movement class representation"""
 
+    __slots__ = (
+        "stock_movement_id", "name", "product", "type", "description", "quantity", "created_time",
+        "last_edited_time", "notion_id"
+    )
+
+    database_id = settings.DB_STOCK_MOVEMENT_ID
+
+    FRAME_COLUMNS = {
+        "ID": "ID",
+        "Name": "Name",
+        "Product": "Product",
+        "Type": "Type",
+        "Description": "Description",
+        "Quantity": "Quantity",
+        "Created Time": "Created time",
+        "Last Edited Time": "Last edited time",
+    }
+    FRAME_DTYPES = {"Quantity": "float64"}
+    ROW_PROPERTIES = (
+        "ID", "Name", "Product", "Type", "Description", "Quantity", "Created time", "Last edited time"
+    )
+
     def __init__(self,
                  stock_movement_id: str,
                  name: str,
@@ -23,7 +45,6 @@ class StockMovement:
                  last_edited_time: datetime,
                  notion_id: Optional[str] = None) -> None:
 
-        self.database_id = settings.DB_STOCK_MOVEMENT_ID
         self.stock_movement_id = stock_movement_id
         self.name = name
         self.product = product
@@ -53,22 +74,6 @@ class StockMovement:
         stock_movement_as_dict = json.loads(stock_movement_as_json)
         return cls.from_dict(stock_movement_as_dict)
 
-    @classmethod
-    def from_dict(cls, stock_movement_as_dict: Dict) -> 'StockMovement':
-        props = extract_properties_to_easy_dict(stock_movement_as_dict)
-
-        return cls(
-            notion_id=stock_movement_as_dict.get('id'),
-            stock_movement_id=props.get('ID'),
-            name=props.get('Name'),
-            product=props.get('Product', []),
-            type=props.get('Type'),
-            description=props.get('Description'),
-            quantity=props.get('Quantity'),
-            created_time=props.get('Created time'),
-            last_edited_time=props.get('Last edited time')
-        )
-
     async def get_parent(self) -> dict:
         return {
             "type": "database_id",
@@ -1,17 +1,35 @@
 import json
 from datetime import datetime
-from typing import Optional, Dict
+from typing import Optional
 
-from utils.notion_utils import extract_properties_to_easy_dict
 from core.config import get_settings
+from models.base_model import NotionModel
 
 
 settings = get_settings()
 
 
-class Store:
+class Store(NotionModel):
     """Store class representation"""
 
+    __slots__ = (
+        "store_id", "name", "store_type", "website", "description", "created_time",
+        "last_edited_time", "notion_id"
+    )
+
+    database_id = settings.DB_STORE_ID
+
+    FRAME_COLUMNS = {
+        "ID": "ID",
+        "Name": "Name",
+        "Type": "Type",
+        "Website": "Website",
+        "Description": "Description",
+        "Created Time": "Created time",
+        "Last Edited Time": "Last edited time",
+    }
+    ROW_PROPERTIES = ("ID", "Name", "Type", "Website", "Description", "Created time", "Last edited time")
+
     def __init__(self,
                  store_id: str,
                  name: str,
@@ -22,7 +40,6 @@ class Store:
                  last_edited_time: datetime,
                  notion_id: Optional[str] = None) -> None:
 
-        self.database_id = settings.DB_STORE_ID
         self.store_id = store_id
         self.name = name
         self.store_type = store_type
@@ -50,21 +67,6 @@ class Store:
         store_as_dict = json.loads(store_as_json)
         return cls.from_dict(store_as_dict)
 
-    @classmethod
-    def from_dict(cls, store_as_dict: Dict) -> 'Store':
-        props = extract_properties_to_easy_dict(store_as_dict)
-
-        return cls(
-            notion_id=store_as_dict.get('id'),
-            store_id=props.get('ID'),
-            name=props.get('Name'),
-            store_type=props.get('Type'),
-            website=props.get('Website'),
-            description=props.get('Description'),
-            created_time=props.get('Created time'),
-            last_edited_time=props.get('Last edited time')
-        )
-
     async def get_parent(self) -> dict:
         return {
             "type": "database_id",
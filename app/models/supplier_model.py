@@ -1,17 +1,39 @@
 import json
 from datetime import datetime
-from typing import Optional, Dict
+from typing import Optional
 
-from utils.notion_utils import extract_properties_to_easy_dict
 from core.config import get_settings
+from models.base_model import NotionModel
 
 
 settings = get_settings()
 
 
-class Supplier:
+class Supplier(NotionModel):
     """Supplier class representation"""
 
+    __slots__ = (
+        "supplier_id", "name", "phone", "address", "email", "cnpj", "description", "created_time",
+        "last_edited_time", "notion_id"
+    )
+
+    database_id = settings.DB_SUPPLIER_ID
+
+    FRAME_COLUMNS = {
+        "ID": "ID",
+        "Name": "Name",
+        "Phone": "Phone",
+        "Address": "Address",
+        "Email": "Email",
+        "CNPJ": "CNPJ",
+        "Description": "Description",
+        "Created Time": "Created time",
+        "Last Edited Time": "Last edited time",
+    }
+    ROW_PROPERTIES = (
+        "ID", "Name", "Phone", "Address", "Email", "CNPJ", "Description", "Created time", "Last edited time"
+    )
+
     def __init__(self,
                  supplier_id: str,
                  name: str,
@@ -24,7 +46,6 @@ class Supplier:
                  last_edited_time: datetime,
                  notion_id: Optional[str] = None) -> None:
 
-        self.database_id = settings.DB_SUPPLIER_ID
         self.supplier_id = supplier_id
         self.name = name
         self.phone = phone
@@ -56,23 +77,6 @@ class Supplier:
         supplier_as_dict = json.loads(supplier_as_json)
         return cls.from_dict(supplier_as_dict)
 
-    @classmethod
-    def from_dict(cls, supplier_as_dict: Dict) -> 'Supplier':
-        props = extract_properties_to_easy_dict(supplier_as_dict)
-
-        return cls(
-            notion_id=supplier_as_dict.get('id'),
-            supplier_id=props.get('ID'),
-            name=props.get('Name'),
-            phone=props.get('Phone'),
-            address=props.get('Address'),
-            email=props.get('Email'),
-            cnpj=props.get('CNPJ'),
-            description=props.get('Description'),
-            created_time=props.get('Created time'),
-            last_edited_time=props.get('Last edited time')
-        )
-
     async def get_parent(self) -> dict:
         return {
             "type": "database_id",
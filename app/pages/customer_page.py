@@ -1,12 +1,11 @@
 import streamlit as st
-import pandas as pd
 
 from components.product_components import (create_product_dialog, create_product_dialog_state,
                                            edit_product_dialog, edit_product_dialog_state,
-                                           delete_product_dialog, delete_product_dialog_state)
-from services.notion_service import list_pages, get_page_name_by_id
+                                           delete_product_dialog, delete_product_dialog_state,
+                                           load_products_view, show_mutation_failures)
 from core.config import get_settings
-from models import Product
+from core.profiling import span
 
 # --- Page configuration ---
 st.set_page_config(page_icon="💾", layout="wide")
@@ -45,21 +44,9 @@ if st.session_state.get("edit_product_dialog_open", False):
 if st.session_state.get("delete_product_dialog_open", False):
     delete_product_dialog()
 
-# --- Function to load products ---
-@st.cache_data
-def load_products() -> pd.DataFrame:
-    """
-    Load products from Notion and convert category IDs to names.
-    """
-    products = pd.concat(
-        [Product.from_dict(p).to_dataframe() for p in list_pages("product")],
-        ignore_index=True,
-    )
-    # Replace category ID with the first category name
-    products["Category"] = products["Category"].apply(lambda c: get_page_name_by_id(c[0]) if c else None)
-    return products
-
-data = load_products()
+# --- Load products (with pending writes applied) ---
+show_mutation_failures()
+data = load_products_view()
 
 
 # --- Metrics ---
@@ -80,17 +67,18 @@ columns_to_show = [
 ]
 
 # Display products in a dataframe with proper column configurations
-st.dataframe(
-    data[columns_to_show],
-    hide_index=True,
-    column_config={
-        "ID": st.column_config.TextColumn(),
-        "Name": st.column_config.TextColumn(),
-        "Price": st.column_config.NumberColumn(format=get_settings().ST_PRODUCT_PRICE_NUMBER_FORMAT),
-        "Category": st.column_config.TextColumn(),
-        "Stock Qty": st.column_config.NumberColumn(),
-        "Print Time": st.column_config.NumberColumn(),
-        "Created Time": st.column_config.DateColumn(format=get_settings().ST_PRODUCT_CREATED_TIME_FORMAT),
-        "Last Edited Time": st.column_config.DateColumn(format=get_settings().ST_PRODUCT_LAST_EDITED_TIME_FORMAT),
-    },
-)
+with span("render", "Customers table"):
+    st.dataframe(
+        data[columns_to_show],
+        hide_index=True,
+        column_config={
+            "ID": st.column_config.TextColumn(),
+            "Name": st.column_config.TextColumn(),
+            "Price": st.column_config.NumberColumn(format=get_settings().ST_PRODUCT_PRICE_NUMBER_FORMAT),
+            "Category": st.column_config.TextColumn(),
+            "Stock Qty": st.column_config.NumberColumn(),
+            "Print Time": st.column_config.NumberColumn(),
+            "Created Time": st.column_config.DateColumn(format=get_settings().ST_PRODUCT_CREATED_TIME_FORMAT),
+            "Last Edited Time": st.column_config.DateColumn(format=get_settings().ST_PRODUCT_LAST_EDITED_TIME_FORMAT),
+        },
+    )
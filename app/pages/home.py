@@ -1,7 +1,8 @@
 import streamlit as st
 
+from core.cache import cached_loader
 from services.notion_service import get_database_count
-from components.product_components import create_product_dialog, create_product_dialog_state
+from components.product_components import create_product_dialog, create_product_dialog_state, show_mutation_failures
 from components.order_components import create_order_dialog, create_order_dialog_state
 from components.order_chart import show_orders_chart
 
@@ -12,6 +13,8 @@ st.title('Home')
 
 st.divider()
 
+show_mutation_failures()
+
 # Layout
 col1, col2, col3, col4 = st.columns(4)
 
@@ -37,7 +40,7 @@ if st.session_state.get("create_order_dialog_open", False):
 
 
 # Metrics Cached Data
-@st.cache_data
+@cached_loader("product", "order")
 def load_data() -> dict:
     response = {
         'product_count': get_database_count('product'),
@@ -1,12 +1,12 @@
 import streamlit as st
-import pandas as pd
 
 from components.product_components import (create_product_dialog, create_product_dialog_state,
                                            edit_product_dialog, edit_product_dialog_state,
-                                           delete_product_dialog, delete_product_dialog_state)
-from services.notion_service import list_pages, get_page_name_by_id
+                                           delete_product_dialog, delete_product_dialog_state,
+                                           import_products_dialog, import_products_dialog_state,
+                                           load_products_view, show_mutation_failures)
 from core.config import get_settings
-from models import Product
+from core.profiling import span
 
 # --- Page configuration ---
 st.set_page_config(page_icon="💾", layout="wide")
@@ -20,7 +20,7 @@ col1.subheader("Quick Actions")
 
 with col1:
     with st.container(border=False):
-        btn_col1, btn_col2, btn_col3 = st.columns([1, 1, 1])
+        btn_col1, btn_col2, btn_col3, btn_col4 = st.columns([1, 1, 1, 1])
 
         with btn_col1:
             # Button to open create product dialog
@@ -37,6 +37,11 @@ with col1:
             if st.button(label="Delete Product", help="Delete an existing product", icon=":material/delete:"):
                 delete_product_dialog_state(True)
 
+        with btn_col4:
+            # Button to open bulk import dialog
+            if st.button(label="Import Products", help="Import products from a CSV or JSONL file", icon=":material/upload:"):
+                import_products_dialog_state(True)
+
 # Show create product dialog if state is active
 if st.session_state.get("create_product_dialog_open", False):
     create_product_dialog()
@@ -44,22 +49,12 @@ if st.session_state.get("edit_product_dialog_open", False):
     edit_product_dialog()
 if st.session_state.get("delete_product_dialog_open", False):
     delete_product_dialog()
+if st.session_state.get("import_products_dialog_open", False):
+    import_products_dialog()
 
-# --- Function to load products ---
-@st.cache_data
-def load_products() -> pd.DataFrame:
-    """
-    Load products from Notion and convert category IDs to names.
-    """
-    products = pd.concat(
-        [Product.from_dict(p).to_dataframe() for p in list_pages("product")],
-        ignore_index=True,
-    )
-    # Replace category ID with the first category name
-    products["Category"] = products["Category"].apply(lambda c: get_page_name_by_id(c[0]) if c else None)
-    return products
-
-data = load_products()
+# --- Load products (with pending writes applied) ---
+show_mutation_failures()
+data = load_products_view()
 
 
 # --- Metrics ---
@@ -80,17 +75,18 @@ columns_to_show = [
 ]
 
 # Display products in a dataframe with proper column configurations
-st.dataframe(
-    data[columns_to_show],
-    hide_index=True,
-    column_config={
-        "ID": st.column_config.TextColumn(),
-        "Name": st.column_config.TextColumn(),
-        "Price": st.column_config.NumberColumn(format=get_settings().ST_PRODUCT_PRICE_NUMBER_FORMAT),
-        "Category": st.column_config.TextColumn(),
-        "Stock Qty": st.column_config.NumberColumn(),
-        "Print Time": st.column_config.NumberColumn(),
-        "Created Time": st.column_config.DateColumn(format=get_settings().ST_PRODUCT_CREATED_TIME_FORMAT),
-        "Last Edited Time": st.column_config.DateColumn(format=get_settings().ST_PRODUCT_LAST_EDITED_TIME_FORMAT),
-    },
-)
+with span("render", "Products table"):
+    st.dataframe(
+        data[columns_to_show],
+        hide_index=True,
+        column_config={
+            "ID": st.column_config.TextColumn(),
+            "Name": st.column_config.TextColumn(),
+            "Price": st.column_config.NumberColumn(format=get_settings().ST_PRODUCT_PRICE_NUMBER_FORMAT),
+            "Category": st.column_config.TextColumn(),
+            "Stock Qty": st.column_config.NumberColumn(),
+            "Print Time": st.column_config.NumberColumn(),
+            "Created Time": st.column_config.DateColumn(format=get_settings().ST_PRODUCT_CREATED_TIME_FORMAT),
+            "Last Edited Time": st.column_config.DateColumn(format=get_settings().ST_PRODUCT_LAST_EDITED_TIME_FORMAT),
+        },
+    )
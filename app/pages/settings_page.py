@@ -1,5 +1,7 @@
 import streamlit as st
-from core.config import get_notion_client, get_db_map
+from core.config import get_notion_client, get_db_map, get_rate_limiter
+from core.cache import cache_stats
+from core.metrics import call_summary, recent_reruns, prometheus_text
 
 
 st.set_page_config(page_title='Settings', page_icon='⚙️', layout='centered')
@@ -16,3 +18,53 @@ if st.button('Test Notion connection'):
         st.balloons()
     except Exception as e:
         st.error(f'Error: {e}')
+
+limiter = get_rate_limiter()
+st.write('Notion request scheduler:')
+col1, col2 = st.columns(2)
+col1.metric('Queued requests', limiter.queue_depth, border=True)
+col2.metric('Rate limited (429)', limiter.throttled, border=True)
+
+stats = cache_stats()
+st.write('Shared data cache:')
+col1, col2, col3, col4 = st.columns(4)
+col1.metric('Hits', stats['hits'], border=True)
+col2.metric('Stale hits', stats['stale_hits'], border=True)
+col3.metric('Misses', stats['misses'], border=True)
+col4.metric('Background refreshes', stats['refreshes'], border=True)
+
+st.write('Notion API calls:')
+summary = call_summary()
+calls = sum(row['Calls'] for row in summary)
+col1, col2, col3 = st.columns(3)
+col1.metric('Calls', calls, border=True)
+col2.metric('Error rate', f"{sum(r['Error rate'] * r['Calls'] for r in summary) / calls:.1%}" if calls else '-', border=True)
+col3.metric('429 rate', f"{sum(r['429 rate'] * r['Calls'] for r in summary) / calls:.1%}" if calls else '-', border=True)
+st.dataframe(
+    summary,
+    hide_index=True,
+    column_config={
+        "Error rate": st.column_config.NumberColumn(format="percent"),
+        "429 rate": st.column_config.NumberColumn(format="percent"),
+        "Mean ms": st.column_config.NumberColumn(format="%.0f"),
+        "p95 ms ≤": st.column_config.NumberColumn(format="%.0f"),
+    },
+)
+
+st.write('Calls per rerun (most recent first):')
+st.dataframe(recent_reruns(), hide_index=True)
+
+st.download_button(
+    'Export metrics (Prometheus)',
+    data=prometheus_text(),
+    file_name='notion_metrics.prom',
+    mime='text/plain',
+)
+
+st.toggle(
+    'Profile reruns',
+    value=st.session_state.get('profiling', False),
+    key='profiling_toggle',
+    on_change=lambda: st.session_state.update(profiling=st.session_state['profiling_toggle']),
+    help='Show a timeline of the loaders, cache lookups, API calls, transforms and renders of each rerun in the sidebar.',
+)
@@ -0,0 +1,105 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Dict, Iterable, List, Optional, TypeVar
+
+from notion_client import AsyncClient
+
+from core.config import get_async_notion_client, get_db_map, get_settings
+from core import mirror
+from services.notion_service import (
+    NOTION_MAX_PAGE_SIZE, list_pages, get_property_ids, query_key, single_flight_async
+)
+from utils.notion_query import Query
+
+db = get_db_map()
+settings = get_settings()
+
+T = TypeVar("T")
+
+
+# ---- Concurrency helpers ----
+async def gather_bounded(awaitables: Iterable[Awaitable[T]], limit: Optional[int] = None) -> List[T]:
+    """Await all `awaitables` concurrently, with at most `limit` of them in flight."""
+    semaphore = asyncio.Semaphore(limit or settings.NOTION_MAX_CONCURRENCY)
+
+    async def bounded(awaitable: Awaitable[T]) -> T:
+        async with semaphore:
+            return await awaitable
+
+    return await asyncio.gather(*(bounded(a) for a in awaitables))
+
+
+def run_sync(coro: Awaitable[T]) -> T:
+    """Run a coroutine from synchronous (Streamlit) code."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+    # Already inside an event loop: run in a worker thread with its own loop
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
+
+
+# ---- Async queries ----
+async def query_database_async(notion: AsyncClient, **kwargs) -> dict:
+    """`databases.query`, coalesced with identical queries in flight, sync or async."""
+    return await single_flight_async(query_key(kwargs), lambda: notion.databases.query(**kwargs))
+
+
+async def query_all_pages(notion: AsyncClient,
+                          db_name: str,
+                          query: Optional[Query] = None,
+                          filter_properties: Optional[List[str]] = None) -> List[dict]:
+    """Fetch every page of a database matching `query`, following the query cursor."""
+    db_id = db.get(db_name)
+    if not db_id:
+        raise ValueError(f"Database '{db_name}' not found in configuration.")
+
+    results, cursor = [], None
+    limit = settings.NOTION_QUERY_LIMIT
+    while True:
+        kwargs: Dict[str, Any] = {"database_id": db_id, "page_size": NOTION_MAX_PAGE_SIZE}
+        if query:
+            kwargs.update(query.to_kwargs())
+        if filter_properties:
+            kwargs["filter_properties"] = filter_properties
+        if cursor:
+            kwargs["start_cursor"] = cursor
+        res = await query_database_async(notion, **kwargs)
+        results.extend(res.get("results", []))
+        if not res.get("has_more") or len(results) >= limit:
+            return results[:limit]
+        cursor = res["next_cursor"]
+
+
+async def fetch_databases_async(db_names: Iterable[str],
+                                properties: Optional[Dict[str, List[str]]] = None) -> Dict[str, List[dict]]:
+    """
+    Query several databases concurrently on one AsyncClient. The client is closed
+    explicitly, since its context manager swaps in a bare httpx client.
+    """
+    db_names = list(db_names)
+    properties = properties or {}
+    # Resolved up front: schemas are retrieved (once per process) by the sync client
+    filter_properties = {name: get_property_ids(name, properties[name]) for name in db_names if name in properties}
+    notion = get_async_notion_client()
+    try:
+        results = await gather_bounded(
+            query_all_pages(notion, name, filter_properties=filter_properties.get(name)) for name in db_names
+        )
+    finally:
+        await notion.aclose()
+    return dict(zip(db_names, results))
+
+
+# ---- Sync wrappers for Streamlit callers ----
+def fetch_databases(db_names: Iterable[str],
+                    properties: Optional[Dict[str, List[str]]] = None) -> Dict[str, List[dict]]:
+    """
+    Fetch the pages of several databases concurrently, with only the
+    `properties` listed for a database when it has an entry.
+    """
+    if mirror.is_enabled():
+        return {name: list_pages(name) for name in db_names}
+    return run_sync(fetch_databases_async(db_names, properties))
+
@@ -4,6 +4,9 @@ from typing import Dict, Any, Optional
 
 from models import Category
 from core.config import get_notion_client
+from core import mirror
+from services.notion_service import adjust_database_count
+from core.cache import invalidate
 
 
 def create_category_on_notion(category: Category) -> Optional[Dict[str, Any]]:
@@ -15,6 +18,9 @@ def create_category_on_notion(category: Category) -> Optional[Dict[str, Any]]:
             properties=category.get_notion_json(),
             icon=category.get_icon()
         )
+        mirror.record_page(response)
+        adjust_database_count(category.database_id, +1)
+        invalidate("category")
         st.toast(f"Category '{category.name}' created successfully!", icon="✅")
         return response
     
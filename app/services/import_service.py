@@ -0,0 +1,148 @@
+import csv
+import io
+import json
+import math
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional
+
+from models import Product, Category
+from core.config import get_settings
+from services.notion_service import iter_pages
+from services.category_service import create_category_on_notion
+from services.product_service import create_product_page
+from utils.notion_utils import extract_properties
+
+settings = get_settings()
+
+# Accepted column names (lower-cased) -> product field
+COLUMN_ALIASES = {
+    "name": "name",
+    "price": "price",
+    "category": "category",
+    "print time": "print_time",
+    "print_time": "print_time",
+}
+
+
+def _empty_row(error: Optional[str] = None) -> Dict[str, Any]:
+    return {"name": None, "price": 0.0, "category": None, "print_time": 0.0, "error": error}
+
+
+def _normalize_row(raw: Any) -> Dict[str, Any]:
+    """Map a parsed row to product fields; problems are kept in its "error" instead of raised."""
+    if not isinstance(raw, dict):
+        return _empty_row(f"Expected an object, got {raw!r}")
+    row = _empty_row()
+    errors = []
+    for key, value in raw.items():
+        field = COLUMN_ALIASES.get(str(key).strip().lower())
+        if field is None:
+            continue
+        if isinstance(value, str):
+            value = value.strip()
+        if field in ("price", "print_time"):
+            try:
+                value = float(str(value).replace(",", ".")) if value not in (None, "") else 0.0
+            except ValueError:
+                value = math.nan
+            if not math.isfinite(value):
+                errors.append(f"{key} is not a number: {raw[key]!r}")
+                continue
+        elif value is not None and not isinstance(value, str):
+            errors.append(f"{key} must be text, got {value!r}")
+            continue
+        row[field] = value or row[field]
+    row["error"] = "; ".join(errors) or None
+    return row
+
+
+def read_product_rows(file_name: str, content: bytes) -> List[Dict[str, Any]]:
+    """
+    Parse a CSV or JSONL catalog into rows with name, price, category and print_time.
+    Rows that can't be read (bad JSON, a non-numeric price...) get an "error"
+    and are reported by `import_products` instead of failing the whole file.
+    """
+    text = content.decode("utf-8-sig")
+    if file_name.lower().endswith((".jsonl", ".ndjson")):
+        rows = []
+        for line in text.splitlines():
+            if not line.strip():
+                continue
+            try:
+                rows.append(_normalize_row(json.loads(line)))
+            except ValueError as e:
+                rows.append(_empty_row(f"Invalid JSON: {e}"))
+        return rows
+    if file_name.lower().endswith(".csv"):
+        return [_normalize_row(r) for r in csv.DictReader(io.StringIO(text))]
+    raise ValueError(f"Unsupported file type: '{file_name}'. Use .csv or .jsonl.")
+
+
+def _names_to_ids(db_name: str) -> Dict[str, str]:
+    return {
+        extract_properties(page, ["Name"]).get("Name"): page["id"]
+        for page in iter_pages(db_name, properties=["Name"])
+    }
+
+
+def resolve_categories(names: List[str]) -> Dict[str, Optional[str]]:
+    """Map category names to Notion IDs, creating each missing category once."""
+    category_ids: Dict[str, Optional[str]] = _names_to_ids("category")
+    for name in dict.fromkeys(n for n in names if n):
+        if name not in category_ids:
+            response = create_category_on_notion(Category(name=name))
+            category_ids[name] = response.get("id") if response else None
+    return category_ids
+
+
+def import_products(rows: List[Dict[str, Any]],
+                    on_progress: Optional[Callable[[int, int], None]] = None) -> List[Dict[str, Any]]:
+    """
+    Create the products of a catalog concurrently (the shared rate limiter keeps us
+    under the API limit). Products whose name already exists in Notion, or appears
+    earlier in the file, are skipped, so re-running an import is safe.
+    Returns one result per row: row number, name, status, Notion ID and error.
+    """
+    results: List[Dict[str, Any]] = [
+        {"Row": i + 1, "Name": row["name"], "Status": None, "NotionID": None, "Error": None}
+        for i, row in enumerate(rows)
+    ]
+    existing = _names_to_ids("product")
+    category_ids = resolve_categories([row["category"] for row in rows if not row.get("error")])
+
+    to_create = {}
+    for result, row in zip(results, rows):
+        if row.get("error"):
+            result.update(Status="error", Error=row["error"])
+        elif not row["name"]:
+            result.update(Status="error", Error="Missing product name")
+        elif row["name"] in existing:
+            result.update(Status="skipped", NotionID=existing[row["name"]])
+        elif row["category"] and not category_ids.get(row["category"]):
+            result.update(Status="error", Error=f"Could not create category '{row['category']}'")
+        else:
+            existing[row["name"]] = None
+            to_create[result["Row"]] = Product(
+                name=row["name"],
+                price=row["price"],
+                print_time=row["print_time"],
+                category=[category_ids[row["category"]]] if row["category"] else []
+            )
+
+    done = len(rows) - len(to_create)
+    if on_progress:
+        on_progress(done, len(rows))
+
+    with ThreadPoolExecutor(max_workers=settings.NOTION_MAX_CONCURRENCY) as executor:
+        futures = {executor.submit(create_product_page, product): row for row, product in to_create.items()}
+        for future in as_completed(futures):
+            result = results[futures[future] - 1]
+            try:
+                result.update(Status="created", NotionID=future.result().get("id"))
+            except Exception as e:
+                result.update(Status="error", Error=str(e))
+            done += 1
+            if on_progress:
+                on_progress(done, len(rows))
+
+    return results
@@ -0,0 +1,161 @@
+import queue
+import threading
+import time
+import uuid
+from typing import Any, Callable, Dict, List, Optional
+
+import httpx
+import pandas as pd
+from notion_client.errors import HTTPResponseError, RequestTimeoutError
+
+from core.config import get_settings
+
+settings = get_settings()
+
+# Mutations run one at a time, in order, on a single background worker
+_queue: "queue.Queue[dict]" = queue.Queue()
+_lock = threading.Lock()
+_worker: Optional[threading.Thread] = None
+
+# db_name -> mutation id -> {"op": "create" | "update" | "delete", "row": {..., "NotionID": ...}},
+# in the order the writes were queued
+_pending: Dict[str, Dict[str, dict]] = {}
+# session_id -> messages of writes that failed for good
+_failures: Dict[str, List[str]] = {}
+
+
+def _is_retryable(error: Exception) -> bool:
+    """
+    Whether Notion certainly did not apply the write: rate limited, a server
+    error, or a request that never got through. Writes aren't idempotent, so
+    a timeout once the request was sent is not retried.
+    """
+    if isinstance(error, HTTPResponseError):
+        return error.status == 429 or error.status >= 500
+    if isinstance(error, RequestTimeoutError):
+        return isinstance(error.__context__, (httpx.ConnectTimeout, httpx.PoolTimeout))
+    return isinstance(error, httpx.ConnectError)
+
+
+def _report_failure(mutation: dict, message: str) -> None:
+    with _lock:
+        _failures.setdefault(mutation["session_id"], []).append(message)
+
+
+def _run(mutation: dict) -> None:
+    response, sent = None, False
+    for attempt in range(settings.MUTATION_MAX_RETRIES + 1):
+        try:
+            response, sent = mutation["action"](), True
+            break
+        except Exception as e:
+            if attempt == settings.MUTATION_MAX_RETRIES or not _is_retryable(e):
+                _report_failure(mutation, f"Could not {mutation['description']}: {e}")
+                break
+            time.sleep(2 ** attempt)
+
+    # Local bookkeeping runs once; the write itself already landed in Notion
+    if sent and mutation["on_success"]:
+        try:
+            mutation["on_success"](response)
+        except Exception as e:
+            _report_failure(mutation, f"Saved ({mutation['description']}), but could not refresh local data: {e}")
+
+    with _lock:
+        _pending.get(mutation["db_name"], {}).pop(mutation["key"], None)
+    if mutation["on_done"]:
+        mutation["on_done"]()
+
+
+def _work() -> None:
+    while True:
+        mutation = _queue.get()
+        try:
+            _run(mutation)
+        except Exception as e:
+            print(f"Error running mutation '{mutation['description']}':{e}")
+        finally:
+            _queue.task_done()
+
+
+def _ensure_worker() -> None:
+    global _worker
+    with _lock:
+        if _worker is None or not _worker.is_alive():
+            _worker = threading.Thread(target=_work, name="notion-mutations", daemon=True)
+            _worker.start()
+
+
+def enqueue_mutation(db_name: str,
+                     op: str,
+                     action: Callable[[], Any],
+                     row: Dict[str, Any],
+                     description: str,
+                     session_id: Optional[str] = None,
+                     notion_id: Optional[str] = None,
+                     on_success: Optional[Callable[[Any], None]] = None,
+                     on_done: Optional[Callable[[], None]] = None) -> str:
+    """
+    Queue a Notion write and return immediately. Until it completes, `row` is
+    patched into the views of `db_name` by `apply_pending_mutations`: appended
+    for a create, merged by `notion_id` for an update, dropped for a delete.
+    `action` should only make the API call: it is retried when Notion surely
+    didn't apply it. `on_success` then runs once with its response (local
+    caches, counts...), and `on_done` after the write finished either way.
+    Returns the id of the mutation.
+    """
+    # Several writes to the same page may be queued, so each gets its own id;
+    # a page being created uses it as a placeholder NotionID
+    key = f"pending-{uuid.uuid4()}"
+    with _lock:
+        _pending.setdefault(db_name, {})[key] = {"op": op, "row": {**row, "NotionID": notion_id or key}}
+    _queue.put({
+        "db_name": db_name,
+        "key": key,
+        "action": action,
+        "on_success": on_success,
+        "description": description,
+        "session_id": session_id,
+        "on_done": on_done,
+    })
+    _ensure_worker()
+    return key
+
+
+def apply_pending_mutations(db_name: str, df: pd.DataFrame) -> pd.DataFrame:
+    """Return a copy of a cached view with the writes still in flight applied to it."""
+    with _lock:
+        pending = list(_pending.get(db_name, {}).items())
+    if not pending:
+        return df
+
+    df = df.copy()
+    created = []
+    for _, mutation in pending:
+        notion_id = mutation["row"]["NotionID"]
+        if mutation["op"] == "create":
+            created.append(mutation["row"])
+        elif mutation["op"] == "delete":
+            df = df[df["NotionID"] != notion_id]
+        else:
+            mask = df["NotionID"] == notion_id
+            for column, value in mutation["row"].items():
+                if column in df.columns:
+                    df.loc[mask, column] = value
+
+    if created:
+        df = pd.concat([df, pd.DataFrame(created)], ignore_index=True)
+    return df
+
+
+def pending_mutations_count(db_name: Optional[str] = None) -> int:
+    with _lock:
+        if db_name is not None:
+            return len(_pending.get(db_name, {}))
+        return sum(len(p) for p in _pending.values())
+
+
+def pop_mutation_failures(session_id: Optional[str]) -> List[str]:
+    """Failed writes of a session, cleared once read."""
+    with _lock:
+        return _failures.pop(session_id, [])
@@ -1,11 +1,94 @@
-from typing import Dict, Any, List, Optional
+import asyncio
+import contextvars
+import json
+import threading
+import time
+from urllib.parse import unquote
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Dict, Any, Awaitable, List, Optional, Iterable, Iterator, Callable, Tuple, TypeVar
 
 # from app.models import Category, Product, Customer, Supplier, Store, Order, OrderItem, Stock, StockMovement
-from utils.notion_utils import extract_properties_to_easy_dict
-from core.config import get_notion_client, get_db_map
+from utils.notion_query import Query, title_equals, timestamp_between
+from core.config import get_notion_client, get_db_map, get_settings
+from core import mirror
+from core.cache import get_ttl
+from core.rate_limiter import background_priority
 
 notion = get_notion_client()
 db = get_db_map()
+settings = get_settings()
+
+# Notion never returns more than 100 results per query
+NOTION_MAX_PAGE_SIZE = 100
+
+T = TypeVar("T")
+
+
+# ---- Request coalescing ----
+_in_flight: Dict[str, Future] = {}
+_in_flight_lock = threading.Lock()
+
+
+def single_flight(key: str, fn: Callable[[], T]) -> T:
+    """
+    Run `fn` once for all concurrent callers using the same `key` (across
+    threads, hence across Streamlit sessions): the first caller makes the
+    request, the others wait for and share its result or error.
+    Shared results must not be mutated.
+    """
+    with _in_flight_lock:
+        future = _in_flight.get(key)
+        leader = future is None
+        if leader:
+            future = _in_flight[key] = Future()
+
+    if not leader:
+        return future.result()
+
+    try:
+        result = fn()
+        future.set_result(result)
+        return result
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _in_flight_lock:
+            del _in_flight[key]
+
+
+async def single_flight_async(key: str, fn: Callable[[], Awaitable[T]]) -> T:
+    """`single_flight` for coroutines, sharing its keys with the synchronous callers."""
+    with _in_flight_lock:
+        future = _in_flight.get(key)
+        leader = future is None
+        if leader:
+            future = _in_flight[key] = Future()
+
+    if not leader:
+        return await asyncio.wrap_future(future)
+
+    try:
+        result = await fn()
+        future.set_result(result)
+        return result
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _in_flight_lock:
+            del _in_flight[key]
+
+
+def query_key(kwargs: Dict[str, Any]) -> str:
+    """Coalescing key of a `databases.query` call."""
+    return "query:" + json.dumps(kwargs, sort_keys=True, default=str)
+
+
+def query_database(**kwargs) -> dict:
+    """`databases.query`, coalesced with identical (database, filter, sorts, cursor...) queries in flight."""
+    return single_flight(query_key(kwargs), lambda: notion.databases.query(**kwargs))
+
 
 # ---- Low-level helpers ----
 def create_page(db_id: str, properties: Dict[str, Any]) -> dict:
@@ -16,33 +99,245 @@ def update_page(page_id: str, properties: Dict[str, Any]) -> dict:
     return notion.pages.update(page_id=page_id, properties=properties)
 
 
-def find_by_title(db_id: str, title_prop: str, title: str) -> Optional[dict]:
-    res = notion.databases.query(database_id=db_id, filter={
-        "property": title_prop,
-        "title": {"equals": title}
-    })
+def find_by_title(db_id: str, title_prop: str, title: str, query: Optional[Query] = None) -> Optional[dict]:
+    """First page whose title is `title`, among those matching `query` if given."""
+    query = (query or Query()).where(title_equals(title_prop, title))
+    res = query_database(database_id=db_id, page_size=1, **query.to_kwargs())
     results = res.get('results', [])
     return results[0] if results else None
 
 
-def list_pages(db_name: str, page_size: int = 50) -> List[dict]:
+def get_database_id(db_name: str) -> str:
+    """Resolve a database name from the configuration to its Notion ID."""
     db_id = db.get(db_name)
     if not db_id:
         raise ValueError(f"Database '{db_name}' not found in configuration.")
-    res = notion.databases.query(database_id=db_id, page_size=page_size)
-    return res.get('results', [])
+    return db_id
+
+
+# ---- Database schemas ----
+_schemas: Dict[str, Dict[str, dict]] = {}
+_schemas_lock = threading.Lock()
+
+
+def get_database_schema(db_name: str, refresh: bool = False) -> Dict[str, dict]:
+    """Property name -> property object (id, type...) of a database, retrieved once per process."""
+    with _schemas_lock:
+        schema = None if refresh else _schemas.get(db_name)
+    if schema is None:
+        db_id = get_database_id(db_name)
+        database = single_flight(f"database:{db_id}", lambda: notion.databases.retrieve(database_id=db_id))
+        schema = database.get("properties", {})
+        with _schemas_lock:
+            _schemas[db_name] = schema
+    return schema
+
+
+def get_property_ids(db_name: str, names: Iterable[str]) -> List[str]:
+    """
+    IDs of the given properties, for `filter_properties`. The schema is retrieved
+    again once if a name is unknown (new or renamed property); names still
+    unknown are dropped.
+    """
+    names = list(names)
+    schema = get_database_schema(db_name)
+    if any(name not in schema for name in names):
+        schema = get_database_schema(db_name, refresh=True)
+    # Schema IDs come URL-encoded and the client encodes query parameters again
+    return [unquote(schema[name]["id"]) for name in names if name in schema]
+
+
+def iter_page_batches(db_name: str,
+                      page_size: int = NOTION_MAX_PAGE_SIZE,
+                      query: Optional[Query] = None,
+                      filter_properties: Optional[List[str]] = None,
+                      limit: Optional[int] = None) -> Iterator[List[dict]]:
+    """
+    Yield the pages of a database matching `query` one API batch at a time,
+    following `start_cursor`/`has_more`. The next batch is requested in the
+    background while the caller is still working on the current one, unless
+    `limit` pages have already arrived.
+    """
+    db_id = get_database_id(db_name)
+    page_size = min(page_size, NOTION_MAX_PAGE_SIZE)
+
+    def fetch(cursor: Optional[str]) -> dict:
+        kwargs = {"database_id": db_id, "page_size": page_size}
+        if query:
+            kwargs.update(query.to_kwargs())
+        if filter_properties:
+            kwargs["filter_properties"] = filter_properties
+        if cursor:
+            kwargs["start_cursor"] = cursor
+        return query_database(**kwargs)
+
+    # Run the prefetches in the caller's context so they keep its request priority
+    context = contextvars.copy_context()
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        pending = executor.submit(context.run, fetch, None)
+        received = 0
+        while pending is not None:
+            res = pending.result()
+            results = res.get("results", [])
+            received += len(results)
+            more = res.get("has_more") and (limit is None or received < limit)
+            pending = executor.submit(context.run, fetch, res["next_cursor"]) if more else None
+            yield results
+
+
+def iter_pages(db_name: str,
+               page_size: int = NOTION_MAX_PAGE_SIZE,
+               limit: Optional[int] = None,
+               query: Optional[Query] = None,
+               properties: Optional[Iterable[str]] = None) -> Iterator[dict]:
+    """
+    Yield the pages of a database matching `query` (all of them by default) as
+    batches arrive, stopping after `limit` pages. When `properties` are given,
+    Notion only returns those; such partial pages must not be stored in the mirror.
+    Unfiltered reads are served from the local mirror (full pages) when it is
+    enabled; filtered or sorted ones go to Notion.
+    """
+    limit = settings.NOTION_QUERY_LIMIT if limit is None else limit
+    if mirror.is_enabled() and not query:
+        pages = mirror.read_pages(ensure_mirrored(db_name))
+    else:
+        filter_properties = get_property_ids(db_name, properties) if properties is not None else None
+        pages = (
+            page
+            for batch in iter_page_batches(db_name, page_size=page_size, query=query,
+                                           filter_properties=filter_properties, limit=limit)
+            for page in batch
+        )
+
+    for count, page in enumerate(pages):
+        if count >= limit:
+            return
+        yield page
+
+
+def list_pages(db_name: str,
+               page_size: int = NOTION_MAX_PAGE_SIZE,
+               limit: Optional[int] = None,
+               query: Optional[Query] = None,
+               properties: Optional[Iterable[str]] = None) -> List[dict]:
+    """Collect the pages of a database matching `query`, bounded by `limit` (defaults to NOTION_QUERY_LIMIT)."""
+    return list(iter_pages(db_name, page_size=page_size, limit=limit, query=query, properties=properties))
+
+
+# ---- Local mirror sync ----
+_sync_lock = threading.Lock()
+_sync_thread: Optional[threading.Thread] = None
+
+
+def sync_database(db_name: str, full: bool = False) -> int:
+    """
+    Bring the local mirror of a database up to date. Incremental syncs only ask
+    Notion for pages edited since the last checkpoint; a full sync also drops
+    pages that were archived or deleted in Notion. Returns the number of pages fetched.
+    """
+    db_id = get_database_id(db_name)
+    state = mirror.get_sync_state(db_id)
+    started_at = time.time()
+
+    if full or state is None or not state["checkpoint"]:
+        pages = [page for batch in iter_page_batches(db_name) for page in batch]
+        checkpoint = mirror.replace_pages(db_id, pages)
+        mirror.save_sync_state(db_id, checkpoint, started_at, full=True)
+        # Pages archived or deleted elsewhere are gone from the mirror now
+        forget_database_count(db_name)
+        return len(pages)
+
+    # Notion rounds last_edited_time to the minute, so re-read the checkpoint minute
+    edited_since = Query(timestamp_between("last_edited_time", start=state["checkpoint"]))
+    pages = [page for batch in iter_page_batches(db_name, query=edited_since) for page in batch]
+    checkpoint = max(filter(None, [state["checkpoint"], mirror.upsert_pages(db_id, pages)]))
+    mirror.save_sync_state(db_id, checkpoint, started_at)
+    return len(pages)
+
+
+def ensure_mirrored(db_name: str) -> str:
+    """Sync a database into the mirror if it never was, and return its ID."""
+    db_id = get_database_id(db_name)
+    if mirror.get_sync_state(db_id) is None:
+        sync_database(db_name, full=True)
+    return db_id
+
+
+def sync_all_databases() -> None:
+    """Sync every configured database, doing a full resync when the last one is too old."""
+    for db_name, db_id in db.items():
+        if not db_id:
+            continue
+        state = mirror.get_sync_state(db_id)
+        full = state is None or not state["full_synced_at"] \
+            or time.time() - state["full_synced_at"] > settings.MIRROR_FULL_SYNC_INTERVAL
+        try:
+            sync_database(db_name, full=full)
+        except Exception as e:
+            print(f"Error syncing database {db_name}:{e}")
+
+
+def start_mirror_sync() -> None:
+    """Start the process-wide background job refreshing the mirror, once."""
+    global _sync_thread
+    with _sync_lock:
+        if _sync_thread is not None and _sync_thread.is_alive():
+            return
+
+        def run() -> None:
+            with background_priority():
+                while True:
+                    sync_all_databases()
+                    time.sleep(settings.MIRROR_SYNC_INTERVAL)
+
+        _sync_thread = threading.Thread(target=run, name="notion-mirror-sync", daemon=True)
+        _sync_thread.start()
+
+
+# ---- Counts ----
+# Title property ID, the same in every database
+TITLE_PROPERTY_ID = "title"
+
+# db_name -> (count, time.monotonic() when it was counted)
+_counts: Dict[str, Tuple[int, float]] = {}
+_counts_lock = threading.Lock()
+
+
+def count_pages(db_name: str) -> int:
+    """Count the pages of a database, paging through IDs with only the title property."""
+    if mirror.is_enabled():
+        return mirror.count_pages(ensure_mirrored(db_name))
+    return sum(len(batch) for batch in iter_page_batches(db_name, filter_properties=[TITLE_PROPERTY_ID]))
 
 
 def get_database_count(db_name: str) -> int:
-    return len(list_pages(db_name))
+    """
+    Number of pages in a database. Our own writes are applied to it right away;
+    it is counted again once older than the database's cache TTL, so pages
+    created or archived elsewhere show up too.
+    """
+    with _counts_lock:
+        cached = _counts.get(db_name)
+        if cached is not None and time.monotonic() - cached[1] < get_ttl(db_name):
+            return cached[0]
+    counted_at = time.monotonic()
+    count = count_pages(db_name)
+    with _counts_lock:
+        _counts[db_name] = (count, counted_at)
+    return count
 
 
-def get_page_name_by_id(page_id: str) -> str | None:
-    """Fetch a page by its ID and return its name."""
-    try:
-        page = notion.pages.retrieve(page_id=page_id)
-        props = extract_properties_to_easy_dict(page)
-        return props.get("Name")
-    except Exception as e:
-        print(f"Error fetching page {page_id}:{e}")
-        return None
+def adjust_database_count(database_id: str, delta: int) -> None:
+    """Apply a page creation (+1) or archive (-1) to the cached count of a database."""
+    key = database_id.replace("-", "")
+    with _counts_lock:
+        for db_name, db_id in db.items():
+            if db_id and db_id.replace("-", "") == key and db_name in _counts:
+                count, counted_at = _counts[db_name]
+                _counts[db_name] = (count + delta, counted_at)
+
+
+def forget_database_count(db_name: str) -> None:
+    """Have the next `get_database_count` count the database again."""
+    with _counts_lock:
+        _counts.pop(db_name, None)
@@ -4,6 +4,10 @@ import streamlit as st
 
 from models import Order
 from core.config import get_notion_client
+from core import mirror
+from core.cache import invalidate
+from services.notion_service import adjust_database_count
+from services.order_window_service import record_order
 
 
 def create_order_on_notion(order: Order) -> Optional[Dict[str, Any]]:
@@ -15,6 +19,10 @@ def create_order_on_notion(order: Order) -> Optional[Dict[str, Any]]:
             properties=order.get_notion_json(),
             icon=order.get_icon()
         )
+        mirror.record_page(response)
+        adjust_database_count(order.database_id, +1)
+        record_order(response)
+        invalidate("order")
 
         st.toast(f"Pedido '{order.name}' criado com sucesso!", icon="✅")
         return response
@@ -0,0 +1,207 @@
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+import pandas as pd
+
+from core.config import get_settings
+from core.cache import get_ttl, on_invalidate
+from core.profiling import span
+from services.notion_service import iter_pages
+from utils.notion_query import Query, date_between, timestamp_between
+from utils.notion_utils import extract_properties
+
+settings = get_settings()
+
+# Properties the orders rollup reads
+ORDER_ROLLUP_PROPERTIES = ("Date", "Total Value")
+
+# Process-wide daily rollup of the orders dated on or after `_since`:
+# day -> [order count, total value], and each order's contribution to it
+_daily: Dict[date, List[float]] = {}
+_contributions: Dict[str, Tuple[date, float]] = {}
+_since: Optional[date] = None
+# Orders edited on or after this time are fetched by the next delta
+_checkpoint: Optional[str] = None
+_refreshed_at = 0.0
+_loaded_at = 0.0
+_stale = False
+# Guards the state above; never held across Notion calls
+_lock = threading.Lock()
+# One window fetch at a time, so concurrent reruns don't load the same orders twice
+_fetch_lock = threading.Lock()
+
+
+def _checkpoint_floor() -> str:
+    """
+    Checkpoint to use when a fetch saw no orders: the minute before now, in
+    Notion's format, since Notion rounds last_edited_time down to the minute.
+    """
+    return (datetime.now(timezone.utc) - timedelta(minutes=1)).strftime("%Y-%m-%dT%H:%M:00.000Z")
+
+
+def _order_day(page: dict) -> Tuple[Optional[date], float]:
+    props = extract_properties(page, ORDER_ROLLUP_PROPERTIES)
+    start = props.get("Date")
+    return (date.fromisoformat(start[:10]) if start else None), float(props.get("Total Value") or 0)
+
+
+def _apply(order_id: str, day: Optional[date], total: float) -> None:
+    """Replace the contribution of an order to the daily rollup (removing it when `day` is None)."""
+    previous = _contributions.pop(order_id, None)
+    if previous is not None:
+        bucket = _daily[previous[0]]
+        bucket[0] -= 1
+        bucket[1] -= previous[1]
+        if bucket[0] == 0:
+            del _daily[previous[0]]
+
+    if day is not None and day >= _since:
+        _contributions[order_id] = (day, total)
+        bucket = _daily.setdefault(day, [0, 0.0])
+        bucket[0] += 1
+        bucket[1] += total
+
+
+def _fetch(query: Query) -> Tuple[Dict[str, Tuple[Optional[date], float]], Optional[str]]:
+    """
+    Day and total of each order matching `query`, and the latest last_edited_time
+    seen. Nothing is applied to the rollup here, so a failed fetch leaves it as it was.
+    """
+    orders: Dict[str, Tuple[Optional[date], float]] = {}
+    latest = None
+    for page in iter_pages("order", query=query, properties=ORDER_ROLLUP_PROPERTIES):
+        orders[page["id"]] = _order_day(page)
+        latest = max(filter(None, [latest, page.get("last_edited_time")]), default=None)
+    return orders, latest
+
+
+def _reset() -> None:
+    global _since, _checkpoint
+    _daily.clear()
+    _contributions.clear()
+    _since, _checkpoint = None, None
+
+
+def mark_orders_stale() -> None:
+    """Have the next read fetch the orders created or edited since the last one."""
+    global _stale
+    with _lock:
+        _stale = True
+
+
+on_invalidate("order", mark_orders_stale)
+
+
+def _plan(start: date, now: float) -> Tuple[Optional[str], Optional[Query]]:
+    """
+    What the rollup needs before it covers `start` (call with `_lock` held):
+    a "reload" of the whole window (first read, or every MIRROR_FULL_SYNC_INTERVAL
+    so orders archived in Notion drop out), an "extend" to the dates not loaded
+    yet, a "delta" of the orders edited since the checkpoint once they're older
+    than their TTL or invalidated, or nothing.
+    """
+    if _since is None or now - _loaded_at > settings.MIRROR_FULL_SYNC_INTERVAL:
+        return "reload", Query(date_between("Date", start, None))
+    if start < _since:
+        return "extend", Query(date_between("Date", start, _since - timedelta(days=1)))
+    if _stale or now - _refreshed_at > get_ttl("order"):
+        # Notion rounds last_edited_time to the minute, so the checkpoint minute is read again
+        return "delta", Query(timestamp_between("last_edited_time", start=_checkpoint))
+    return None, None
+
+
+def _ensure_window(start: date) -> None:
+    """
+    Bring the rollup up to date for orders dated on or after `start`. Orders
+    are fetched without holding `_lock` and merged only once the whole fetch
+    succeeded; a failed fetch changes nothing and is retried by the next read.
+    """
+    global _since, _checkpoint, _refreshed_at, _loaded_at, _stale
+    with _lock:
+        kind, _ = _plan(start, time.monotonic())
+    if kind is None:
+        return
+    # A loaded window is still served while another rerun fetches its delta
+    if not _fetch_lock.acquire(blocking=kind != "delta"):
+        return
+    try:
+        now = time.monotonic()
+        with _lock:
+            # Planned again: another rerun may have fetched while we waited
+            kind, query = _plan(start, now)
+            if kind in ("reload", "delta"):
+                # Invalidations arriving during the fetch set it again
+                _stale = False
+        if kind is None:
+            return
+
+        floor = _checkpoint_floor()
+        try:
+            orders, latest = _fetch(query)
+        except Exception:
+            with _lock:
+                _stale = _stale or kind != "extend"
+            raise
+
+        with _lock:
+            if kind == "reload":
+                _reset()
+                _since = start
+            elif kind == "extend":
+                _since = start
+            for order_id, (day, total) in orders.items():
+                _apply(order_id, day, total)
+
+            # The checkpoint is the latest last_edited_time Notion returned: any later
+            # edit is stamped in that minute or after. An extension only sees its own
+            # dates, so it can't move the checkpoint past edits of the others.
+            if kind == "reload":
+                _checkpoint = latest or floor
+                _loaded_at = _refreshed_at = now
+            elif kind == "delta":
+                _checkpoint = max(filter(None, [_checkpoint, latest]))
+                _refreshed_at = now
+    finally:
+        _fetch_lock.release()
+
+
+def record_order(page: dict) -> None:
+    """Apply an order page we just wrote to the rollup, if it is loaded."""
+    with _lock:
+        if _since is not None:
+            _apply(page["id"], *((None, 0.0) if page.get("archived") else _order_day(page)))
+
+
+def _period_start(day: date, period: str) -> date:
+    if period == "Weekly":
+        return day - timedelta(days=day.weekday())
+    if period == "Monthly":
+        return day.replace(day=1)
+    return day.replace(month=1, day=1)
+
+
+def rollup_orders(period: str, start: date) -> pd.DataFrame:
+    """
+    Order count and total value per week, month or year since `start`,
+    derived from the daily rollup in a single pass over its days.
+    """
+    with span("loader", "order window"):
+        _ensure_window(start)
+    with _lock:
+        days = [(day, bucket[0], bucket[1]) for day, bucket in _daily.items() if day >= start]
+
+    with span("transform", f"rollup_orders({period})"):
+        buckets: Dict[date, List[float]] = {}
+        for day, count, total in days:
+            bucket = buckets.setdefault(_period_start(day, period), [0, 0.0])
+            bucket[0] += count
+            bucket[1] += total
+
+        dates = sorted(buckets)
+        return pd.DataFrame({
+            "Date": pd.to_datetime(pd.Series(dates, dtype=object)),
+            "Orders": [int(buckets[d][0]) for d in dates],
+            "Total Value": [buckets[d][1] for d in dates],
+        })
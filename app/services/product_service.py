@@ -4,18 +4,79 @@ import streamlit as st
 
 from models import Product
 from core.config import get_notion_client
+from core import mirror
+from core.cache import invalidate
+from services.notion_service import adjust_database_count
 
 
+# ---- Notion writes (raise on failure, safe to call from worker threads) ----
+# The send_* functions only make the API call, so a failed call can be retried
+# without repeating the local bookkeeping done by record_product_write.
+def send_product_create(product: Product) -> Dict[str, Any]:
+    """Create a product page in Notion and return it."""
+    notion_client = get_notion_client()
+    return notion_client.pages.create(
+        parent={"database_id": product.database_id},
+        properties=product.get_notion_json(),
+        icon=product.get_icon()
+    )
+
+
+def send_product_update(product: Product) -> Dict[str, Any]:
+    """Update an existing product page in Notion and return it."""
+    notion_client = get_notion_client()
+    return notion_client.pages.update(
+        page_id=product.notion_id,
+        parent={"database_id": product.database_id},
+        properties=product.get_notion_json(),
+        icon=product.get_icon()
+    )
+
+
+def send_product_archive(product: Product) -> Dict[str, Any]:
+    """Archive a product page in Notion and return it."""
+    notion_client = get_notion_client()
+    return notion_client.pages.update(
+        page_id=product.notion_id,
+        parent={"database_id": product.database_id},
+        archived=True
+    )
+
+
+def record_product_write(product: Product, response: Dict[str, Any], count_delta: int = 0) -> None:
+    """Apply a product write that Notion accepted to the mirror, the page count and the caches."""
+    mirror.record_page(response)
+    if count_delta:
+        adjust_database_count(product.database_id, count_delta)
+    invalidate("product")
+
+
+def create_product_page(product: Product) -> Dict[str, Any]:
+    """Create a product page in Notion and return it."""
+    response = send_product_create(product)
+    record_product_write(product, response, +1)
+    return response
+
+
+def update_product_page(product: Product) -> Dict[str, Any]:
+    """Update an existing product page in Notion and return it."""
+    response = send_product_update(product)
+    record_product_write(product, response)
+    return response
+
+
+def archive_product_page(product: Product) -> Dict[str, Any]:
+    """Archive a product page in Notion and return it."""
+    response = send_product_archive(product)
+    record_product_write(product, response, -1)
+    return response
+
+
+# ---- UI actions ----
 def create_product_on_notion(product: Product) -> Optional[Dict[str, Any]]:
     """Create a new product in Notion database."""
     try:
-        notion_client = get_notion_client()
-        response = notion_client.pages.create(
-            parent={"database_id": product.database_id},
-            properties=product.get_notion_json(),
-            icon=product.get_icon()
-        )
-
+        response = create_product_page(product)
         st.toast(f"Produto '{product.name}' criado com sucesso!", icon="✅")
         return response
     except Exception as e:
@@ -26,14 +87,7 @@ def create_product_on_notion(product: Product) -> Optional[Dict[str, Any]]:
 def edit_product_on_notion(product: Product) -> Optional[Dict[str, Any]]:
     """Edit an existing product in Notion database."""
     try:
-        notion_client = get_notion_client()
-        response = notion_client.pages.update(
-            page_id=product.notion_id,
-            parent={"database_id": product.database_id},
-            properties=product.get_notion_json(),
-            icon=product.get_icon()
-        )
-
+        response = update_product_page(product)
         st.toast(f"Produto '{product.name}' editado com sucesso!", icon="✅")
         return response
     except Exception as e:
@@ -44,13 +98,7 @@ def edit_product_on_notion(product: Product) -> Optional[Dict[str, Any]]:
 def delete_product_on_notion(product: Product) -> Optional[Dict[str, Any]]:
     """Delete an existing product in Notion database."""
     try:
-        notion_client = get_notion_client()
-        response = notion_client.pages.update(
-            page_id=product.notion_id,
-            parent={"database_id": product.database_id},
-            archived=True
-        )
-
+        response = archive_product_page(product)
         st.toast(f"Produto '{product.name}' deletado com sucesso!", icon="✅")
         return response
     except Exception as e:
@@ -0,0 +1,64 @@
+from typing import Dict, Generic, Iterable, List, Optional, Type, TypeVar
+
+from models import Product, Category
+from models.base_model import NotionModel
+from core.cache import cached_loader
+from services.notion_service import iter_pages
+
+M = TypeVar("M", bound=NotionModel)
+
+# Product fields the product dialogs read
+PRODUCT_FORM_COLUMNS = ("ID", "Name", "Price", "Category", "Print Time")
+
+
+class ReferenceData(Generic[M]):
+    """
+    The pages of a database as models, with hash indexes for the lookups the
+    dialogs do on every rerun: name -> ID, ID -> model and name -> option index.
+    When names repeat, the first page wins, like a linear scan would.
+    Shared across sessions, so it must be treated as read-only.
+    """
+
+    __slots__ = ("items", "options", "_by_id", "_ids_by_name", "_index_by_name")
+
+    def __init__(self, model: Type[M], pages: Iterable[dict]) -> None:
+        self.items: List[M] = model.from_pages(pages)
+        self.options: List[str] = [item.name for item in self.items]
+        self._by_id: Dict[str, M] = {item.notion_id: item for item in self.items}
+        self._ids_by_name: Dict[str, str] = {}
+        self._index_by_name: Dict[str, int] = {}
+        for index, item in enumerate(self.items):
+            self._ids_by_name.setdefault(item.name, item.notion_id)
+            self._index_by_name.setdefault(item.name, index)
+
+    def __len__(self) -> int:
+        return len(self.items)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._ids_by_name
+
+    def get(self, notion_id: Optional[str]) -> Optional[M]:
+        return self._by_id.get(notion_id)
+
+    def id_of(self, name: Optional[str]) -> Optional[str]:
+        return self._ids_by_name.get(name)
+
+    def name_of(self, notion_id: Optional[str]) -> Optional[str]:
+        item = self._by_id.get(notion_id)
+        return item.name if item else None
+
+    def index_of(self, name: Optional[str]) -> Optional[int]:
+        """Position of `name` in `options`, e.g. for a selectbox index."""
+        return self._index_by_name.get(name)
+
+
+# Kept in the shared loader cache: refreshed once older than the database's TTL,
+# and dropped as soon as one of our writes invalidates the database
+@cached_loader("category")
+def get_categories() -> ReferenceData[Category]:
+    return ReferenceData(Category, iter_pages("category", properties=["Name"]))
+
+
+@cached_loader("product")
+def get_products() -> ReferenceData[Product]:
+    return ReferenceData(Product, iter_pages("product", properties=Product.properties(PRODUCT_FORM_COLUMNS)))
@@ -0,0 +1,95 @@
+import threading
+import time
+from typing import Dict, Optional, Set, Tuple
+
+import pandas as pd
+
+from utils.notion_utils import extract_properties_to_easy_dict
+from services.notion_service import iter_pages, db, single_flight
+from core.cache import get_ttl, on_invalidate
+from core.profiling import span
+
+
+class _NameMap:
+    """ID -> name map of a database, and the IDs known to be missing from it."""
+
+    __slots__ = ("names", "unknown", "loaded_at")
+
+    def __init__(self, names: Dict[str, str]) -> None:
+        self.names = names
+        self.unknown: Set[str] = set()
+        self.loaded_at = time.monotonic()
+
+
+# Process-wide maps per database, shared across reruns and sessions until their TTL expires
+_name_maps: Dict[str, _NameMap] = {}
+# db_name -> bumped on invalidation, so loads started before it aren't stored
+_generations: Dict[str, int] = {}
+# Guards the dicts above; never held across Notion calls
+_lock = threading.Lock()
+
+
+def _load_name_map(db_name: str) -> Dict[str, str]:
+    """Fetch every page of a database in one paginated query and map its ID to its name."""
+    return {
+        page["id"]: extract_properties_to_easy_dict(page).get("Name")
+        for page in iter_pages(db_name, properties=["Name"])
+    }
+
+
+def _get_entry(db_name: str, refresh: bool = False) -> Tuple[_NameMap, bool]:
+    """The map of a database, loaded when missing, older than its TTL or `refresh`ed; and whether it was."""
+    with _lock:
+        entry = _name_maps.get(db_name)
+        generation = _generations.get(db_name, 0)
+    if entry is not None and not refresh and time.monotonic() - entry.loaded_at < get_ttl(db_name):
+        return entry, False
+
+    # Concurrent reloads of the same map make a single query
+    entry = _NameMap(single_flight(f"name-map:{db_name}", lambda: _load_name_map(db_name)))
+    with _lock:
+        if _generations.get(db_name, 0) == generation:
+            _name_maps[db_name] = entry
+    return entry, True
+
+
+def get_name_map(db_name: str, refresh: bool = False) -> Dict[str, str]:
+    """Return the ID -> name map of a database, loading it when missing or older than its TTL."""
+    return _get_entry(db_name, refresh)[0].names
+
+
+def invalidate_name_map(db_name: Optional[str] = None) -> None:
+    """Drop the map of one database, or of all of them."""
+    with _lock:
+        for name in ([db_name] if db_name is not None else list(_name_maps)):
+            _generations[name] = _generations.get(name, 0) + 1
+            _name_maps.pop(name, None)
+
+
+# Drop a database's map whenever its cached data is invalidated
+for _db_name in db:
+    on_invalidate(_db_name, lambda db_name=_db_name: invalidate_name_map(db_name))
+
+
+def resolve_relation_names(column: pd.Series, db_name: str) -> pd.Series:
+    """
+    Replace a column of relation ID lists by the name of the first related
+    page in `db_name` (category, store, customer, product...). All distinct IDs
+    are resolved against one bulk query. New IDs trigger a single reload; those
+    still missing after it (archived pages...) stay unresolved until the map's
+    next reload instead of reloading it on every call.
+    """
+    with span("transform", f"resolve_relation_names({db_name})"):
+        ids = column.str[0]
+        entry, loaded = _get_entry(db_name)
+
+        wanted = set(ids.dropna())
+        with _lock:
+            new_ids = wanted - entry.names.keys() - entry.unknown
+        if new_ids and not loaded:
+            entry, _ = _get_entry(db_name, refresh=True)
+        if new_ids:
+            with _lock:
+                entry.unknown.update(wanted - entry.names.keys())
+
+        return ids.map(entry.names)
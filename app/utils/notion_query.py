@@ -0,0 +1,134 @@
+import json
+from datetime import date, datetime
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+DateLike = Union[date, datetime, str]
+
+
+def _iso(value: DateLike) -> str:
+    return value if isinstance(value, str) else value.isoformat()
+
+
+class Condition:
+    """
+    A Notion database filter, combinable with `&` and `|`.
+    Conditions are immutable and hashable by their canonical JSON.
+    """
+
+    __slots__ = ("body", "key")
+
+    def __init__(self, body: Dict[str, Any]) -> None:
+        self.body = body
+        self.key = json.dumps(body, sort_keys=True)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return json.loads(self.key)
+
+    def __and__(self, other: "Condition") -> "Condition":
+        return and_(self, other)
+
+    def __or__(self, other: "Condition") -> "Condition":
+        return or_(self, other)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Condition) and self.key == other.key
+
+    def __hash__(self) -> int:
+        return hash(self.key)
+
+    def __repr__(self) -> str:
+        return f"Condition({self.key})"
+
+
+def _compound(kind: str, conditions: Tuple[Condition, ...]) -> Condition:
+    parts: List[Dict[str, Any]] = []
+    for condition in conditions:
+        # Flatten (a & b) & c into a single "and", Notion only allows two levels of nesting
+        parts.extend(condition.body[kind] if kind in condition.body else [condition.body])
+    return Condition(parts[0]) if len(parts) == 1 else Condition({kind: parts})
+
+
+def and_(*conditions: Condition) -> Condition:
+    return _compound("and", conditions)
+
+
+def or_(*conditions: Condition) -> Condition:
+    return _compound("or", conditions)
+
+
+def _range(start: Optional[DateLike], end: Optional[DateLike]) -> List[Dict[str, str]]:
+    bounds = []
+    if start is not None:
+        bounds.append({"on_or_after": _iso(start)})
+    if end is not None:
+        bounds.append({"on_or_before": _iso(end)})
+    if not bounds:
+        raise ValueError("A date range needs a start, an end or both.")
+    return bounds
+
+
+def date_between(prop: str, start: Optional[DateLike] = None, end: Optional[DateLike] = None) -> Condition:
+    """Pages whose date property falls within [start, end]; either bound may be open."""
+    return and_(*(Condition({"property": prop, "date": bound}) for bound in _range(start, end)))
+
+
+def timestamp_between(timestamp: str, start: Optional[DateLike] = None, end: Optional[DateLike] = None) -> Condition:
+    """Same as `date_between` on "created_time" or "last_edited_time"."""
+    return and_(*(Condition({"timestamp": timestamp, timestamp: bound}) for bound in _range(start, end)))
+
+
+def relation_contains(prop: str, page_id: str) -> Condition:
+    return Condition({"property": prop, "relation": {"contains": page_id}})
+
+
+def select_equals(prop: str, value: str) -> Condition:
+    return Condition({"property": prop, "select": {"equals": value}})
+
+
+def title_equals(prop: str, value: str) -> Condition:
+    return Condition({"property": prop, "title": {"equals": value}})
+
+
+class Query:
+    """
+    Filter and sorts of a database query, pushed down to Notion so only the
+    matching pages are transferred. Immutable and hashable, so it can be used as
+    a cache key: `Query().where(select_equals("Status", "Paid")).order_by("Date")`.
+    """
+
+    __slots__ = ("filter", "sorts")
+
+    def __init__(self, filter: Optional[Condition] = None, sorts: Tuple[Tuple[str, str, str], ...] = ()) -> None:
+        self.filter = filter
+        self.sorts = sorts
+
+    def where(self, condition: Condition) -> "Query":
+        """Narrow the query, and-ing `condition` with the current filter."""
+        return Query(self.filter & condition if self.filter else condition, self.sorts)
+
+    def order_by(self, prop: str, descending: bool = False) -> "Query":
+        return Query(self.filter, self.sorts + (("property", prop, "descending" if descending else "ascending"),))
+
+    def order_by_timestamp(self, timestamp: str, descending: bool = False) -> "Query":
+        return Query(self.filter, self.sorts + (("timestamp", timestamp, "descending" if descending else "ascending"),))
+
+    def to_kwargs(self) -> Dict[str, Any]:
+        """Arguments of `databases.query` for this query."""
+        kwargs: Dict[str, Any] = {}
+        if self.filter is not None:
+            kwargs["filter"] = self.filter.to_dict()
+        if self.sorts:
+            kwargs["sorts"] = [{kind: name, "direction": direction} for kind, name, direction in self.sorts]
+        return kwargs
+
+    def __bool__(self) -> bool:
+        return self.filter is not None or bool(self.sorts)
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Query) and (self.filter, self.sorts) == (other.filter, other.sorts)
+
+    def __hash__(self) -> int:
+        return hash((self.filter, self.sorts))
+
+    def __repr__(self) -> str:
+        return f"Query({self.to_kwargs()})"
@@ -1,5 +1,9 @@
 import pytz
 from datetime import datetime
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Tuple
+
+import pandas as pd
 
 from notion_client import Client
 
@@ -14,40 +18,6 @@ def get_database_data(notion: Client, database_id: str):
     results.extend(query.get("results", []))
     return results
 
-def extract_properties_to_easy_dict(page: dict) -> dict:
-    """Extract properties from a Notion page object to an easy dict."""
-    props = {}
-    properties = page.get("properties", {})
-
-    for key, val in properties.items():
-        val_type = val.get("type")
-
-        handlers = {
-            "unique_id": lambda v: f"{v['unique_id']['prefix']}-{v['unique_id']['number']}" if v.get("unique_id") else None,
-            "title": lambda v: v["title"][0]["plain_text"] if v.get("title") else "",
-            "rich_text": lambda v: v["rich_text"][0]["plain_text"] if v.get("rich_text") else "",
-            "number": lambda v: v.get("number"),
-            "date": lambda v: v["date"]["start"] if v.get("date") else None,
-            "select": lambda v: v["select"]["name"] if v.get("select") else None,
-            "phone_number": lambda v: v.get("phone_number"),
-            "url": lambda v: v.get("url"),
-            "email": lambda v: v.get("email"),
-            "formula": lambda v: v["formula"]["number"] if v.get("formula") else 0,
-            "relation": lambda v: [r["id"] for r in v.get("relation", [])],
-            "created_by": lambda v: v.get("created_by"),
-            "last_edited_time": lambda v: format_datetime(v.get("last_edited_time")),
-            "created_time": lambda v: format_datetime(v.get("created_time")),
-        }
-
-        if val_type == "rollup":
-            props[key] = handle_rollup(val)
-        elif val_type in handlers:
-            props[key] = handlers[val_type](val)
-        else:
-            props[key] = None
-
-    return props
-
 def handle_rollup(val: dict):
     """Handle Notion rollup fields."""
     rollup_type = val.get("rollup", {}).get("type")
@@ -67,6 +37,100 @@ def handle_rollup(val: dict):
 
     return 0
 
+# Property type -> accessor, built once at import
+PROPERTY_HANDLERS: Dict[str, Callable[[dict], Any]] = {
+    "unique_id": lambda v: f"{v['unique_id']['prefix']}-{v['unique_id']['number']}" if v.get("unique_id") else None,
+    "title": lambda v: v["title"][0]["plain_text"] if v.get("title") else "",
+    "rich_text": lambda v: v["rich_text"][0]["plain_text"] if v.get("rich_text") else "",
+    "number": lambda v: v.get("number"),
+    "date": lambda v: v["date"]["start"] if v.get("date") else None,
+    "select": lambda v: v["select"]["name"] if v.get("select") else None,
+    "phone_number": lambda v: v.get("phone_number"),
+    "url": lambda v: v.get("url"),
+    "email": lambda v: v.get("email"),
+    "formula": lambda v: v["formula"]["number"] if v.get("formula") else 0,
+    "relation": lambda v: [r["id"] for r in v.get("relation", [])],
+    "created_by": lambda v: v.get("created_by"),
+    # Timestamps stay raw ISO strings; see localize_datetime_columns
+    "last_edited_time": lambda v: v.get("last_edited_time"),
+    "created_time": lambda v: v.get("created_time"),
+    "rollup": handle_rollup,
+}
+
+def _unknown_property(val: dict) -> None:
+    return None
+
+def extract_properties_to_easy_dict(page: dict) -> dict:
+    """Extract properties from a Notion page object to an easy dict."""
+    return {
+        key: PROPERTY_HANDLERS.get(val.get("type"), _unknown_property)(val)
+        for key, val in page.get("properties", {}).items()
+    }
+
+def extract_properties(page: dict, names: Iterable[str]) -> dict:
+    """Extract only the given properties of a page; properties missing from the page are left out."""
+    properties = page.get("properties", {})
+    props = {}
+    for name in names:
+        val = properties.get(name)
+        if val is not None:
+            props[name] = PROPERTY_HANDLERS.get(val.get("type"), _unknown_property)(val)
+    return props
+
+class PropertyExtractor:
+    """
+    Property extractor compiled once per database schema: every property name
+    is bound to its accessor up front, so extracting a page is a single pass
+    over prebuilt (name, accessor) pairs returning a row tuple.
+    """
+
+    def __init__(self, schema: Dict[str, str]) -> None:
+        self.names: Tuple[str, ...] = tuple(schema)
+        self._accessors = tuple(
+            (name, PROPERTY_HANDLERS.get(prop_type, _unknown_property)) for name, prop_type in schema.items()
+        )
+
+    @classmethod
+    def from_database(cls, database: dict) -> 'PropertyExtractor':
+        """Compile from a `databases.retrieve` response."""
+        return get_extractor(tuple((name, prop["type"]) for name, prop in database.get("properties", {}).items()))
+
+    @classmethod
+    def from_page(cls, page: dict) -> 'PropertyExtractor':
+        """Compile from the properties of a sample page of the database."""
+        return get_extractor(tuple((name, val.get("type")) for name, val in page.get("properties", {}).items()))
+
+    def index(self, name: str) -> int:
+        return self.names.index(name)
+
+    def extract(self, page: dict) -> tuple:
+        """Extract one page to a row tuple ordered like `names`; missing properties are None."""
+        get = page.get("properties", {}).get
+        return tuple([
+            None if (val := get(name)) is None else accessor(val)
+            for name, accessor in self._accessors
+        ])
+
+    def extract_dict(self, page: dict) -> dict:
+        return dict(zip(self.names, self.extract(page)))
+
+    def extract_many(self, pages: Iterable[dict]) -> List[tuple]:
+        """Extract a batch of pages of the same database to row tuples."""
+        extract = self.extract
+        return [extract(page) for page in pages]
+
+@lru_cache(maxsize=64)
+def get_extractor(schema: Tuple[Tuple[str, str], ...]) -> PropertyExtractor:
+    """Compiled extractor for a schema given as (name, type) pairs, built once."""
+    return PropertyExtractor(dict(schema))
+
+def localize_datetime_columns(df: pd.DataFrame, columns: Iterable[str]) -> pd.DataFrame:
+    """Parse raw ISO timestamp columns in one pass each, converted to the default timezone."""
+    for column in columns:
+        if column in df.columns:
+            df[column] = pd.to_datetime(df[column], utc=True, format="ISO8601").dt.tz_convert(settings.DEFAULT_TIMEZONE)
+    return df
+
 def convert_time_zone(date: datetime) -> datetime:
     """Convert a datetime object to a different timezone."""
     if not date:
@@ -74,7 +138,7 @@ def convert_time_zone(date: datetime) -> datetime:
     return date.astimezone(pytz.timezone(settings.DEFAULT_TIMEZONE))
 
 def format_datetime(iso_str):
-    """Convert ISO datetime string to formatted string."""
+    """Convert ISO datetime string to formatted string, for display only."""
     if not iso_str:
         return None
     return convert_time_zone(datetime.fromisoformat(iso_str)).strftime(settings.DEFAULT_DATE_FORMAT)
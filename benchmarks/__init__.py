@@ -0,0 +1,20 @@
+"""
+Offline benchmarks. Run from the repository root, e.g.:
+
+    python -m benchmarks.bench_extractor
+    python -m benchmarks.bench_suite --sizes 1000 10000 100000
+"""
+import os
+import sys
+from pathlib import Path
+
+# The app modules import each other as top-level packages (models, services...)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "app"))
+
+# Settings require an API key; benchmarks never talk to Notion
+os.environ.setdefault("NOTION_API_KEY", "offline-benchmark")
+# Don't cap the 100k-page corpora
+os.environ.setdefault("NOTION_QUERY_LIMIT", "1000000")
+# Database IDs the fixtures are generated with
+for _db_name in ("product", "category", "customer", "store", "order"):
+    os.environ.setdefault(f"DB_{_db_name.upper()}_ID", f"db-{_db_name}")
@@ -0,0 +1,85 @@
+import gc
+import time
+import tracemalloc
+
+from benchmarks import fixtures  # noqa: F401  (sets up sys.path and settings)
+from core.config import get_settings
+from models import Product
+from utils.notion_utils import extract_properties_to_easy_dict
+
+
+class LegacyProduct:
+    """The previous Product layout: a per-instance __dict__ that also stores the database ID."""
+
+    def __init__(self, name, product_id=None, price=0.0, stock=None, category=None, stock_qty=None,
+                 print_time=0.0, created_time=None, last_edited_time=None, notion_id=None) -> None:
+        self.database_id = get_settings().DB_PRODUCT_ID
+        self.product_id = product_id
+        self.name = name
+        self.price = price
+        self.stock = stock
+        self.category = category
+        self.stock_qty = stock_qty
+        self.print_time = print_time
+        self.created_time = created_time
+        self.last_edited_time = last_edited_time
+        self.notion_id = notion_id
+
+    @classmethod
+    def from_dict(cls, page: dict) -> 'LegacyProduct':
+        props = extract_properties_to_easy_dict(page)
+        return cls(
+            notion_id=page.get('id'),
+            product_id=props.get('ID'),
+            name=props.get('Name'),
+            price=props.get('Price'),
+            stock=props.get('Stock', []),
+            category=props.get('Category', []),
+            stock_qty=props.get('Stock Qty'),
+            print_time=props.get('Print Time'),
+            created_time=props.get('Created time'),
+            last_edited_time=props.get('Last edited time')
+        )
+
+
+def _best_time(build, pages, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        objects = build(pages)
+        best = min(best, time.perf_counter() - start)
+        del objects
+    return best
+
+
+def _held_memory(build, pages) -> int:
+    """Bytes still held after building one instance per page."""
+    gc.collect()
+    tracemalloc.start()
+    objects = build(pages)
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return held
+
+
+def main(n: int = 50_000) -> None:
+    pages = fixtures.product_pages(n, fixtures.category_pages(20))
+    builds = {
+        "__dict__ model, from_dict": lambda ps: [LegacyProduct.from_dict(p) for p in ps],
+        "__slots__ model, from_dict": lambda ps: [Product.from_dict(p) for p in ps],
+        "__slots__ model, from_pages": Product.from_pages,
+    }
+
+    print(f"{n} Product instances")
+    baseline = None
+    for label, build in builds.items():
+        held, seconds = _held_memory(build, pages), _best_time(build, pages)
+        baseline = baseline or (held, seconds)
+        print(f"  {label:<28}{held / 2**20:6.1f} MiB {seconds * 1000:8.1f} ms"
+              f"  ({1 - held / baseline[0]:.0%} less memory, {baseline[1] / seconds:.1f}x faster)")
+
+
+if __name__ == "__main__":
+    main()
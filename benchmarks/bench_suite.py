@@ -0,0 +1,117 @@
+"""
+Page-load benchmarks over a replayed Notion corpus; nothing goes over the network.
+
+    python -m benchmarks.bench_suite                        # 1k and 10k pages per database
+    python -m benchmarks.bench_suite --sizes 1000 10000 100000
+    python -m benchmarks.bench_suite --recorded corpus.json
+
+The 100k corpora take minutes, so they only run when asked for.
+
+A recorded corpus is a JSON object mapping database names (product, order,
+category...) to lists of pages or of raw `databases.query` responses. None is
+shipped with the repository: record one from your own workspace to replay it.
+"""
+import argparse
+import gc
+import resource
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+from benchmarks import fixtures
+from benchmarks.replay import install
+from core.cache import invalidate
+from models import Order, Product
+from services import order_window_service
+from services.notion_service import list_pages
+from utils.notion_utils import extract_properties_to_easy_dict
+from components.order_chart import CHART_WINDOWS, group_orders, load_orders, window_start
+from components.product_components import load_products
+
+
+def _peak_rss_mib() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Kilobytes on Linux, bytes on macOS
+    return peak / 2**20 if sys.platform == "darwin" else peak / 2**10
+
+
+def measure(fn: Callable[[], object], repeat: int) -> Dict[str, float]:
+    """Best wall time over `repeat` runs, then the peak traced allocations of one more run."""
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"ms": best * 1000, "alloc_mib": peak / 2**20, "rss_mib": _peak_rss_mib()}
+
+
+def _reset_order_window() -> None:
+    with order_window_service._lock:
+        order_window_service._reset()
+
+
+def cases(corpus: Dict[str, List[dict]]) -> Dict[str, Callable[[], object]]:
+    products, orders = corpus.get("product", []), corpus.get("order", [])
+    order_frame = load_orders()
+
+    def uncached(loader: Callable[[], object], *databases: str) -> Callable[[], object]:
+        def run():
+            invalidate(*databases)
+            return loader()
+        return run
+
+    def rollup(period: str) -> Callable[[], object]:
+        def run():
+            _reset_order_window()
+            return order_window_service.rollup_orders(period, window_start(period))
+        return run
+
+    return {
+        "list_pages(product)": lambda: list_pages("product"),
+        "list_pages(order)": lambda: list_pages("order"),
+        "extract_properties_to_easy_dict": lambda: [extract_properties_to_easy_dict(p) for p in products],
+        "Product.from_pages": lambda: Product.from_pages(products),
+        "Order.from_pages": lambda: Order.from_pages(orders),
+        "load_products": uncached(load_products, "product", "category"),
+        "load_orders": uncached(load_orders, "order"),
+        **{f"group_orders({period})": (lambda p=period: group_orders(order_frame, p)) for period in CHART_WINDOWS},
+        **{f"rollup_orders({period}), cold": rollup(period) for period in CHART_WINDOWS},
+    }
+
+
+def run(corpus: Dict[str, List[dict]], label: str, repeat: int) -> None:
+    client = install(corpus)
+    sizes = ", ".join(f"{db_name}={len(pages)}" for db_name, pages in corpus.items())
+    print(f"\n{label} ({sizes})")
+    print(f"  {'case':<36}{'wall ms':>10}{'alloc MiB':>11}{'peak RSS MiB':>14}{'queries':>9}")
+    for name, fn in cases(corpus).items():
+        queries = client.calls["databases.query"]
+        result = measure(fn, repeat)
+        queries = (client.calls["databases.query"] - queries) // (repeat + 1)
+        print(f"  {name:<36}{result['ms']:>10.1f}{result['alloc_mib']:>11.1f}{result['rss_mib']:>14.1f}{queries:>9}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000],
+                        help="pages per database of the synthetic corpora")
+    parser.add_argument("--recorded", help="also replay this recorded corpus")
+    parser.add_argument("--repeat", type=int, default=3, help="timed runs per case (the best is reported)")
+    args = parser.parse_args()
+
+    for n in args.sizes:
+        run(fixtures.corpus(n), f"synthetic {n}", args.repeat)
+    if args.recorded:
+        run(fixtures.load_recorded(args.recorded), f"recorded {args.recorded}", args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+import json
+import random
+import uuid
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Dict, List
+
+
+def _iso(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%dT%H:%M:00.000Z")
+
+
+def _title(text: str) -> dict:
+    return {"id": "title", "type": "title", "title": [{"type": "text", "plain_text": text, "text": {"content": text}}]}
+
+
+def _rich_text(text: str, prop_id: str) -> dict:
+    return {"id": prop_id, "type": "rich_text", "rich_text": [{"type": "text", "plain_text": text, "text": {"content": text}}]}
+
+
+def _number(value: float, prop_id: str) -> dict:
+    return {"id": prop_id, "type": "number", "number": value}
+
+
+def _relation(ids: List[str], prop_id: str) -> dict:
+    return {"id": prop_id, "type": "relation", "relation": [{"id": i} for i in ids], "has_more": False}
+
+
+def _page(database_id: str, properties: dict, created: datetime, edited: datetime, rng: random.Random) -> dict:
+    return {
+        "object": "page",
+        "id": str(uuid.UUID(int=rng.getrandbits(128), version=4)),
+        "created_time": _iso(created),
+        "last_edited_time": _iso(edited),
+        "archived": False,
+        "in_trash": False,
+        "parent": {"type": "database_id", "database_id": database_id},
+        "properties": properties,
+    }
+
+
+def _timestamps(rng: random.Random) -> tuple:
+    created = datetime(2023, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=rng.randrange(2 * 365 * 24 * 60))
+    return created, created + timedelta(minutes=rng.randrange(60 * 24 * 30))
+
+
+def named_pages(n: int, label: str, prefix: str, seed: int = 0, database_id: str = "db-category") -> List[dict]:
+    """Synthetic pages with only an ID, a name and timestamps (categories, customers, stores...)."""
+    rng = random.Random(seed)
+    pages = []
+    for i in range(n):
+        created, edited = _timestamps(rng)
+        pages.append(_page(database_id, {
+            "ID": {"id": "uid", "type": "unique_id", "unique_id": {"prefix": prefix, "number": i + 1}},
+            "Name": _title(f"{label} {i + 1}"),
+            "Created time": {"id": "ct", "type": "created_time", "created_time": _iso(created)},
+            "Last edited time": {"id": "et", "type": "last_edited_time", "last_edited_time": _iso(edited)},
+        }, created, edited, rng))
+    return pages
+
+
+def category_pages(n: int, seed: int = 0, database_id: str = "db-category") -> List[dict]:
+    return named_pages(n, "Category", "CAT", seed, database_id)
+
+
+def product_pages(n: int, categories: List[dict], seed: int = 0, database_id: str = "db-product") -> List[dict]:
+    """Synthetic product pages shaped like the Notion product database."""
+    rng = random.Random(seed)
+    pages = []
+    for i in range(n):
+        created, edited = _timestamps(rng)
+        pages.append(_page(database_id, {
+            "ID": {"id": "uid", "type": "unique_id", "unique_id": {"prefix": "PRD", "number": i + 1}},
+            "Name": _title(f"Product {i + 1}"),
+            "Price": _number(round(rng.uniform(5, 500), 2), "prc"),
+            "Category": _relation([rng.choice(categories)["id"]] if categories else [], "cat"),
+            "Stock": _relation([], "stk"),
+            "Stock Qty": {"id": "sq", "type": "rollup", "rollup": {"type": "number", "number": rng.randrange(100), "function": "sum"}},
+            "Print Time": _number(round(rng.uniform(0, 20), 1), "ptm"),
+            "Created time": {"id": "ct", "type": "created_time", "created_time": _iso(created)},
+            "Last edited time": {"id": "et", "type": "last_edited_time", "last_edited_time": _iso(edited)},
+        }, created, edited, rng))
+    return pages
+
+
+def order_pages(n: int, stores: List[dict], customers: List[dict], seed: int = 0,
+                database_id: str = "db-order", years: int = 5) -> List[dict]:
+    """Synthetic order pages, dated over the last `years` years."""
+    rng = random.Random(seed)
+    today = date.today()
+    pages = []
+    for i in range(n):
+        created, edited = _timestamps(rng)
+        order_date = today - timedelta(days=rng.randrange(years * 365))
+        pages.append(_page(database_id, {
+            "ID": {"id": "uid", "type": "unique_id", "unique_id": {"prefix": "ORD", "number": i + 1}},
+            "Name": _title(f"Order {i + 1}"),
+            "Date": {"id": "dte", "type": "date", "date": {"start": order_date.isoformat(), "end": None, "time_zone": None}},
+            "Store": _relation([rng.choice(stores)["id"]] if stores else [], "sto"),
+            "Customer": _relation([rng.choice(customers)["id"]] if customers else [], "cus"),
+            "Sale Item": _relation([str(uuid.UUID(int=rng.getrandbits(128), version=4)) for _ in range(rng.randint(1, 4))], "itm"),
+            "Total Value": {"id": "tot", "type": "formula", "formula": {"type": "number", "number": round(rng.uniform(10, 2000), 2)}},
+            "Description": _rich_text(f"Synthetic order {i + 1}", "dsc"),
+            "Created time": {"id": "ct", "type": "created_time", "created_time": _iso(created)},
+            "Last edited time": {"id": "et", "type": "last_edited_time", "last_edited_time": _iso(edited)},
+        }, created, edited, rng))
+    return pages
+
+
+# Seed offset of each database, so no two databases draw the same page IDs
+SEED_OFFSETS = {"category": 0, "store": 1_000, "customer": 2_000, "product": 3_000, "order": 4_000}
+
+
+def corpus(n: int, seed: int = 0) -> Dict[str, List[dict]]:
+    """A synthetic workspace with `n` products and `n` orders, keyed by database name."""
+    seeds = {db_name: seed + offset for db_name, offset in SEED_OFFSETS.items()}
+    categories = category_pages(20, seeds["category"])
+    stores = named_pages(5, "Store", "STO", seeds["store"], "db-store")
+    customers = named_pages(max(n // 10, 1), "Customer", "CUS", seeds["customer"], "db-customer")
+    return {
+        "category": categories,
+        "store": stores,
+        "customer": customers,
+        "product": product_pages(n, categories, seeds["product"]),
+        "order": order_pages(n, stores, customers, seeds["order"]),
+    }
+
+
+def load_recorded(path: str) -> Dict[str, List[dict]]:
+    """
+    Read a recorded corpus: a JSON object mapping database names to either a
+    list of pages or a list of raw `databases.query` responses.
+    """
+    recorded = json.loads(Path(path).read_text(encoding="utf-8"))
+    return {
+        db_name: [page for item in items for page in (item["results"] if "results" in item else [item])]
+        for db_name, items in recorded.items()
+    }
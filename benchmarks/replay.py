@@ -0,0 +1,91 @@
+import json
+from typing import Dict, List, Optional
+
+from benchmarks import fixtures  # noqa: F401  (sets up sys.path and settings)
+from core.config import get_db_map
+from emulator.filters import matches
+
+
+def _key(database_id: str) -> str:
+    return database_id.replace("-", "")
+
+
+class ReplayDatabases:
+    def __init__(self, client: "ReplayClient") -> None:
+        self._client = client
+        # (database, filter) -> matching pages, so paging through a filtered query stays linear
+        self._filtered: Dict[tuple, List[dict]] = {}
+
+    def retrieve(self, database_id: str, **kwargs) -> dict:
+        self._client.calls["databases.retrieve"] += 1
+        pages = self._client.pages_by_database.get(_key(database_id), [])
+        properties = {
+            name: {"id": value["id"], "name": name, "type": value["type"]}
+            for name, value in (pages[0]["properties"].items() if pages else [])
+        }
+        return {"object": "database", "id": database_id, "properties": properties}
+
+    def query(self, database_id: str,
+              filter: Optional[dict] = None,
+              start_cursor: Optional[str] = None,
+              page_size: int = 100,
+              filter_properties: Optional[List[str]] = None,
+              **kwargs) -> dict:
+        """Serve a page of results with Notion's cursor semantics. Sorts are ignored."""
+        self._client.calls["databases.query"] += 1
+        pages = self._client.pages_by_database.get(_key(database_id), [])
+        if filter:
+            cache_key = (_key(database_id), json.dumps(filter, sort_keys=True))
+            if cache_key not in self._filtered:
+                self._filtered[cache_key] = [page for page in pages if matches(page, filter)]
+            pages = self._filtered[cache_key]
+
+        start = int(start_cursor or 0)
+        end = start + min(page_size, 100)
+        batch = pages[start:end]
+        if filter_properties:
+            wanted = set(filter_properties)
+            batch = [
+                {**page, "properties": {n: v for n, v in page["properties"].items() if v["id"] in wanted}}
+                for page in batch
+            ]
+        has_more = end < len(pages)
+        return {"object": "list", "results": batch, "next_cursor": str(end) if has_more else None, "has_more": has_more}
+
+
+class ReplayPages:
+    def __init__(self, client: "ReplayClient") -> None:
+        self._client = client
+
+    def retrieve(self, page_id: str, **kwargs) -> dict:
+        self._client.calls["pages.retrieve"] += 1
+        return self._client.pages_by_id[page_id]
+
+
+class ReplayClient:
+    """
+    Stand-in for the synchronous Notion client serving a fixed corpus from
+    memory, for the read paths the app uses: databases.query/retrieve and
+    pages.retrieve.
+    """
+
+    def __init__(self, corpus: Dict[str, List[dict]]) -> None:
+        db_map = get_db_map()
+        self.pages_by_database = {_key(db_map[db_name]): pages for db_name, pages in corpus.items()}
+        self.pages_by_id = {page["id"]: page for pages in corpus.values() for page in pages}
+        self.calls: Dict[str, int] = {"databases.query": 0, "databases.retrieve": 0, "pages.retrieve": 0}
+        self.databases = ReplayDatabases(self)
+        self.pages = ReplayPages(self)
+
+
+def install(corpus: Dict[str, List[dict]]) -> ReplayClient:
+    """Route the app's Notion reads to a replay of `corpus` and drop everything cached so far."""
+    from services import notion_service
+    from core.cache import invalidate
+
+    client = ReplayClient(corpus)
+    notion_service.notion = client
+    notion_service._schemas.clear()
+    notion_service._counts.clear()
+    invalidate(*get_db_map())
+    return client
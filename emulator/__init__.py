@@ -0,0 +1,14 @@
+"""
+Local, in-memory stand-in for the Notion API, for load, latency and
+failure testing without touching the real workspace. Run from the
+repository root, e.g.:
+
+    python -m emulator --size 10000 --latency 0.2 --rate-limited 0.05
+
+then start the app with NOTION_BASE_URL pointing at it (and the DB_*_ID
+values it prints).
+"""
+from emulator.server import EmulatorServer, Faults
+from emulator.store import NotionError, NotionStore
+
+__all__ = ["EmulatorServer", "Faults", "NotionError", "NotionStore"]
@@ -0,0 +1,54 @@
+import argparse
+import os
+
+from benchmarks import fixtures
+from emulator.server import EmulatorServer, Faults
+from emulator.store import NotionStore
+
+
+def build_store(size: int, recorded: str | None = None, seed: int = 0) -> NotionStore:
+    """A store seeded with a recorded corpus, or with synthetic fixtures of `size` products and orders."""
+    corpus = fixtures.load_recorded(recorded) if recorded else fixtures.corpus(size, seed)
+    store = NotionStore()
+    for db_name, pages in corpus.items():
+        # Same IDs as the fixtures (db-<name>) unless DB_<NAME>_ID is set
+        database_id = os.environ.get(f"DB_{db_name.upper()}_ID", f"db-{db_name}")
+        store.add_database(database_id, pages, title=db_name)
+    return store
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m emulator", description="Local Notion API emulator")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--size", type=int, default=1_000, help="products and orders of the synthetic corpus")
+    parser.add_argument("--recorded", help="seed from a recorded corpus instead (see benchmarks.fixtures.load_recorded)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--latency", type=float, default=0.0, help="seconds added to every request")
+    parser.add_argument("--jitter", type=float, default=0.0, help="up to this many extra seconds, at random")
+    parser.add_argument("--rate-limited", type=float, default=0.0, help="share of requests answered with 429")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After of the 429s, in seconds")
+    parser.add_argument("--server-errors", type=float, default=0.0, help="share of requests answered with 503")
+    parser.add_argument("--verbose", action="store_true", help="log every request")
+    args = parser.parse_args()
+
+    store = build_store(args.size, args.recorded, args.seed)
+    faults = Faults(args.latency, args.jitter, args.rate_limited, args.retry_after, args.server_errors, args.seed)
+    server = EmulatorServer((args.host, args.port), store, faults, verbose=args.verbose)
+
+    print(f"Notion emulator listening on {server.url}. Start the app with:")
+    print(f"  NOTION_BASE_URL={server.url}")
+    for db_name in fixtures.corpus(0) if not args.recorded else fixtures.load_recorded(args.recorded):
+        print(f"  DB_{db_name.upper()}_ID={os.environ.get(f'DB_{db_name.upper()}_ID', f'db-{db_name}')}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+        for endpoint, counts in sorted(server.stats.items()):
+            print(f"  {endpoint}: {counts}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+from datetime import date, datetime, timezone
+from typing import Any, Dict, List, Optional, Tuple
+
+
+def _as_datetime(value: str) -> datetime:
+    parsed = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def _compare(value: Optional[str], condition: Dict[str, str]) -> bool:
+    if not value:
+        return "is_empty" in condition
+    value_dt = _as_datetime(value)
+    for op, bound in condition.items():
+        if op == "is_not_empty":
+            continue
+        if "T" in bound:
+            compared, bound_value = value_dt, _as_datetime(bound)
+        else:
+            # A date-only bound covers that whole day: compare the date the value falls on
+            compared, bound_value = date.fromisoformat(value[:10]), date.fromisoformat(bound)
+        if not {
+            "equals": compared == bound_value,
+            "before": compared < bound_value,
+            "after": compared > bound_value,
+            "on_or_before": compared <= bound_value,
+            "on_or_after": compared >= bound_value,
+        }[op]:
+            return False
+    return True
+
+
+def plain_text(prop: dict) -> str:
+    return "".join(t.get("plain_text", "") for t in prop.get(prop.get("type"), []) or [])
+
+
+def matches(page: dict, filter: dict) -> bool:
+    """Evaluate the subset of Notion filters the app builds (see utils.notion_query) against a page."""
+    if "and" in filter:
+        return all(matches(page, f) for f in filter["and"])
+    if "or" in filter:
+        return any(matches(page, f) for f in filter["or"])
+    if "timestamp" in filter:
+        return _compare(page.get(filter["timestamp"]), filter[filter["timestamp"]])
+
+    prop = page.get("properties", {}).get(filter["property"], {})
+    if "date" in filter:
+        return _compare((prop.get("date") or {}).get("start"), filter["date"])
+    if "relation" in filter:
+        return filter["relation"]["contains"] in {r["id"] for r in prop.get("relation", [])}
+    if "select" in filter:
+        return (prop.get("select") or {}).get("name") == filter["select"]["equals"]
+    if "number" in filter:
+        return prop.get("number") == filter["number"]["equals"]
+    for text_type in ("title", "rich_text"):
+        if text_type in filter:
+            condition = filter[text_type]
+            text = plain_text(prop)
+            if "equals" in condition:
+                return text == condition["equals"]
+            if "contains" in condition:
+                return condition["contains"].lower() in text.lower()
+    raise NotImplementedError(f"Unsupported filter: {filter}")
+
+
+def _sort_value(page: dict, sort: dict) -> Any:
+    if "timestamp" in sort:
+        return page.get(sort["timestamp"])
+    prop = page.get("properties", {}).get(sort["property"], {})
+    value = prop.get(prop.get("type"))
+    if prop.get("type") in ("title", "rich_text"):
+        return plain_text(prop)
+    if prop.get("type") == "date":
+        return (value or {}).get("start")
+    if prop.get("type") == "formula":
+        return (value or {}).get("number")
+    return value
+
+
+def sort_pages(pages: List[dict], sorts: List[dict]) -> List[dict]:
+    """Apply Notion sorts, last one first so the first sort wins; empty values go last."""
+    for sort in reversed(sorts):
+        descending = sort.get("direction") == "descending"
+
+        def key(page: dict, sort: dict = sort) -> Tuple[bool, Any]:
+            value = _sort_value(page, sort)
+            return (value is None) != descending, value if value is not None else 0
+
+        pages = sorted(pages, key=key, reverse=descending)
+    return pages
@@ -0,0 +1,168 @@
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Callable, Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from emulator.store import NotionError, NotionStore
+
+
+class Faults:
+    """
+    Failures and latency injected into every request: a delay of `latency`
+    seconds (plus up to `jitter`), and a share of requests answered with 429
+    (with Retry-After) or a 5xx error instead of being served.
+    """
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, rate_limited: float = 0.0,
+                 retry_after: float = 1.0, server_errors: float = 0.0, seed: Optional[int] = None) -> None:
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limited = rate_limited
+        self.retry_after = retry_after
+        self.server_errors = server_errors
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def draw(self) -> Tuple[float, Optional[NotionError]]:
+        """Delay of the next request, and the error to answer it with, if any."""
+        with self._lock:
+            delay = self.latency + self._rng.uniform(0, self.jitter)
+            roll = self._rng.random()
+        if roll < self.rate_limited:
+            return delay, NotionError(429, "rate_limited", "You have been rate limited. Please try again in a few minutes.")
+        if roll < self.rate_limited + self.server_errors:
+            return delay, NotionError(503, "service_unavailable", "Notion is unavailable, please try again later.")
+        return delay, None
+
+
+# (method, path pattern) -> handler name
+ROUTES: List[Tuple[str, "re.Pattern[str]", str]] = [
+    ("POST", re.compile(r"^/v1/databases/(?P<id>[^/]+)/query$"), "query_database"),
+    ("GET", re.compile(r"^/v1/databases/(?P<id>[^/]+)$"), "retrieve_database"),
+    ("POST", re.compile(r"^/v1/pages$"), "create_page"),
+    ("PATCH", re.compile(r"^/v1/pages/(?P<id>[^/]+)$"), "update_page"),
+    ("GET", re.compile(r"^/v1/pages/(?P<id>[^/]+)$"), "retrieve_page"),
+    ("POST", re.compile(r"^/v1/search$"), "search"),
+]
+
+
+class EmulatorHandler(BaseHTTPRequestHandler):
+    """Serves the Notion REST endpoints the app uses from the server's NotionStore."""
+
+    server: "EmulatorServer"
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format: str, *args) -> None:
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+    def _send(self, status: int, payload: dict, headers: Optional[Dict[str, str]] = None) -> None:
+        body = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self) -> dict:
+        length = int(self.headers.get("Content-Length") or 0)
+        raw = self.rfile.read(length) if length else b""
+        try:
+            body = json.loads(raw) if raw.strip() else {}
+        except ValueError as e:
+            raise NotionError(400, "invalid_json", f"Error parsing JSON body: {e}") from e
+        if not isinstance(body, dict):
+            raise NotionError(400, "validation_error", "body should be an object.")
+        return body
+
+    def _handle(self, method: str) -> None:
+        url = urlsplit(self.path)
+        try:
+            body = self._read_body()
+        except NotionError as e:
+            return self._send(e.status, e.to_dict())
+
+        delay, error = self.server.faults.draw()
+        if delay:
+            time.sleep(delay)
+        self.server.count(method, url.path, error)
+        if error is not None:
+            headers = {"Retry-After": f"{self.server.faults.retry_after:g}"} if error.status == 429 else None
+            return self._send(error.status, error.to_dict(), headers)
+
+        for route_method, pattern, name in ROUTES:
+            match = pattern.match(url.path)
+            if route_method == method and match:
+                break
+        else:
+            error = NotionError(400, "invalid_request_url", f"Invalid request URL: {method} {url.path}")
+            return self._send(error.status, error.to_dict())
+
+        store = self.server.store
+        handlers: Dict[str, Callable[[], dict]] = {
+            "query_database": lambda: store.query_database(
+                match["id"], body, parse_qs(url.query).get("filter_properties")
+            ),
+            "retrieve_database": lambda: store.retrieve_database(match["id"]),
+            "create_page": lambda: store.create_page(body),
+            "update_page": lambda: store.update_page(match["id"], body),
+            "retrieve_page": lambda: store.retrieve_page(match["id"]),
+            "search": lambda: store.search(body),
+        }
+        try:
+            self._send(200, handlers[name]())
+        except NotionError as e:
+            self._send(e.status, e.to_dict())
+        except Exception as e:
+            # Answer instead of dropping the connection, so clients see the failure
+            error = NotionError(500, "internal_server_error", f"Emulator error: {e!r}")
+            self._send(error.status, error.to_dict())
+
+    def do_GET(self) -> None:
+        self._handle("GET")
+
+    def do_POST(self) -> None:
+        self._handle("POST")
+
+    def do_PATCH(self) -> None:
+        self._handle("PATCH")
+
+
+class EmulatorServer(ThreadingHTTPServer):
+    """Local stand-in for api.notion.com; point the app at it with NOTION_BASE_URL."""
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int], store: NotionStore,
+                 faults: Optional[Faults] = None, verbose: bool = False) -> None:
+        super().__init__(address, EmulatorHandler)
+        self.store = store
+        self.faults = faults or Faults()
+        self.verbose = verbose
+        # "METHOD path-template" -> served / injected error counts
+        self.stats: Dict[str, Dict[str, int]] = {}
+        self._stats_lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def count(self, method: str, path: str, error: Optional[NotionError]) -> None:
+        endpoint = f"{method} {re.sub(r'/[0-9a-f-]{8,}|/db-[a-z_]+', '/{id}', path)}"
+        outcome = "served" if error is None else str(error.status)
+        with self._stats_lock:
+            counts = self.stats.setdefault(endpoint, {})
+            counts[outcome] = counts.get(outcome, 0) + 1
+
+    def start(self) -> threading.Thread:
+        """Serve from a daemon thread (e.g. inside a load test) and return it."""
+        thread = threading.Thread(target=self.serve_forever, name="notion-emulator", daemon=True)
+        thread.start()
+        return thread
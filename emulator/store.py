@@ -0,0 +1,221 @@
+import threading
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, List, Optional
+
+from emulator.filters import matches, plain_text, sort_pages
+
+
+class NotionError(Exception):
+    """An API error, returned to the client as Notion's error object."""
+
+    def __init__(self, status: int, code: str, message: str) -> None:
+        super().__init__(message)
+        self.status = status
+        self.code = code
+        self.message = message
+
+    def to_dict(self) -> dict:
+        return {"object": "error", "status": self.status, "code": self.code, "message": self.message}
+
+
+def _key(object_id: str) -> str:
+    return object_id.replace("-", "")
+
+
+def _now() -> str:
+    # Notion reports page timestamps rounded down to the minute
+    return datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:00.000Z")
+
+
+def _rich_text(items: List[dict]) -> List[dict]:
+    return [
+        {**item, "type": item.get("type", "text"),
+         "plain_text": item.get("plain_text", item.get("text", {}).get("content", ""))}
+        for item in items
+    ]
+
+
+def _read_value(prop_type: str, value: dict) -> object:
+    """Convert a property value sent by a client to the shape Notion returns it in."""
+    if prop_type in ("title", "rich_text"):
+        return _rich_text(value.get(prop_type) or [])
+    if prop_type == "relation":
+        return [{"id": r["id"]} for r in value.get("relation") or []]
+    if prop_type == "date":
+        date = value.get("date")
+        return {"start": date["start"], "end": date.get("end"), "time_zone": date.get("time_zone")} if date else None
+    return value.get(prop_type)
+
+
+def _empty_value(schema_prop: dict) -> dict:
+    prop_type = schema_prop["type"]
+    empty = {"title": [], "rich_text": [], "relation": [], "formula": {"type": "number", "number": None},
+             "rollup": {"type": "number", "number": None, "function": "sum"}}.get(prop_type)
+    return {"id": schema_prop["id"], "type": prop_type, prop_type: empty}
+
+
+class NotionStore:
+    """
+    In-memory Notion workspace: databases with a schema inferred from their
+    pages, and pages that can be queried, created, updated and searched like
+    the real API does for the features the app uses.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._databases: Dict[str, dict] = {}
+        self._pages: Dict[str, dict] = {}
+        # database key -> page IDs, in creation order
+        self._order: Dict[str, List[str]] = {}
+        # database key -> unique_id property -> [prefix, last number]
+        self._sequences: Dict[str, Dict[str, list]] = {}
+
+    def add_database(self, database_id: str, pages: List[dict], title: Optional[str] = None) -> None:
+        """Register a database seeded with `pages` (e.g. fixtures); its schema comes from the first page."""
+        schema = {
+            name: {"id": value["id"], "name": name, "type": value["type"]}
+            for name, value in (pages[0]["properties"].items() if pages else [])
+        }
+        with self._lock:
+            self._databases[_key(database_id)] = {
+                "object": "database",
+                "id": database_id,
+                "title": [{"type": "text", "plain_text": title or database_id, "text": {"content": title or database_id}}],
+                "properties": schema,
+            }
+            self._order[_key(database_id)] = []
+            sequences = self._sequences[_key(database_id)] = {
+                name: [None, 0] for name, prop in schema.items() if prop["type"] == "unique_id"
+            }
+            for page in pages:
+                self._pages[page["id"]] = page
+                self._order[_key(database_id)].append(page["id"])
+                for name, sequence in sequences.items():
+                    unique_id = page["properties"].get(name, {}).get("unique_id") or {}
+                    sequence[0] = sequence[0] or unique_id.get("prefix")
+                    sequence[1] = max(sequence[1], unique_id.get("number") or 0)
+
+    def _database(self, database_id: str) -> dict:
+        database = self._databases.get(_key(database_id))
+        if database is None:
+            raise NotionError(404, "object_not_found", f"Could not find database with ID: {database_id}.")
+        return database
+
+    def _page(self, page_id: str) -> dict:
+        page = self._pages.get(page_id)
+        if page is None:
+            raise NotionError(404, "object_not_found", f"Could not find page with ID: {page_id}.")
+        return page
+
+    def retrieve_database(self, database_id: str) -> dict:
+        with self._lock:
+            return self._database(database_id)
+
+    def query_database(self, database_id: str, body: dict, filter_properties: Optional[List[str]] = None) -> dict:
+        with self._lock:
+            self._database(database_id)
+            pages = [self._pages[page_id] for page_id in self._order[_key(database_id)]]
+        pages = [page for page in pages if not page.get("archived")]
+        try:
+            if body.get("filter"):
+                pages = [page for page in pages if matches(page, body["filter"])]
+            if body.get("sorts"):
+                pages = sort_pages(pages, body["sorts"])
+            return self._paginate(pages, body, filter_properties)
+        except (NotImplementedError, KeyError, TypeError, ValueError, AttributeError) as e:
+            # Unsupported or malformed filters, sorts and cursors are rejected like Notion does
+            raise NotionError(400, "validation_error", f"Invalid query: {e}") from e
+
+    @staticmethod
+    def _paginate(results: List[dict], body: dict, filter_properties: Optional[List[str]] = None) -> dict:
+        start = int(body.get("start_cursor") or 0)
+        end = start + min(int(body.get("page_size") or 100), 100)
+        batch = results[start:end]
+        if filter_properties:
+            wanted = set(filter_properties)
+            batch = [
+                {**page, "properties": {n: v for n, v in page["properties"].items() if v["id"] in wanted}}
+                for page in batch
+            ]
+        has_more = end < len(results)
+        return {"object": "list", "type": "page_or_database", "results": batch,
+                "next_cursor": str(end) if has_more else None, "has_more": has_more}
+
+    def _apply_properties(self, page: dict, schema: Dict[str, dict], properties: dict) -> None:
+        for name, value in properties.items():
+            if name not in schema:
+                raise NotionError(400, "validation_error", f"{name} is not a property that exists.")
+            prop_type = schema[name]["type"]
+            page["properties"][name] = {"id": schema[name]["id"], "type": prop_type,
+                                        prop_type: _read_value(prop_type, value)}
+
+    def create_page(self, body: dict) -> dict:
+        database_id = (body.get("parent") or {}).get("database_id")
+        if not database_id:
+            raise NotionError(400, "validation_error", "body.parent.database_id should be defined.")
+        now = _now()
+        with self._lock:
+            database = self._database(database_id)
+            schema = database["properties"]
+            page = {
+                "object": "page",
+                "id": str(uuid.uuid4()),
+                "created_time": now,
+                "last_edited_time": now,
+                "archived": False,
+                "in_trash": False,
+                "icon": body.get("icon"),
+                "parent": {"type": "database_id", "database_id": database["id"]},
+                "properties": {name: _empty_value(prop) for name, prop in schema.items()},
+            }
+            self._apply_properties(page, schema, body.get("properties") or {})
+            for name, prop in schema.items():
+                if prop["type"] in ("created_time", "last_edited_time"):
+                    page["properties"][name][prop["type"]] = now
+                elif prop["type"] == "unique_id":
+                    sequence = self._sequences[_key(database_id)][name]
+                    sequence[1] += 1
+                    page["properties"][name]["unique_id"] = {"prefix": sequence[0], "number": sequence[1]}
+            self._pages[page["id"]] = page
+            self._order[_key(database_id)].append(page["id"])
+            return page
+
+    def update_page(self, page_id: str, body: dict) -> dict:
+        now = _now()
+        with self._lock:
+            page = self._page(page_id)
+            schema = self._database(page["parent"]["database_id"])["properties"]
+            # Pages returned earlier may be held by clients, so never mutate them in place
+            page = {**page, "properties": dict(page["properties"]), "last_edited_time": now}
+            self._apply_properties(page, schema, body.get("properties") or {})
+            if "archived" in body:
+                page["archived"] = page["in_trash"] = bool(body["archived"])
+            if "icon" in body:
+                page["icon"] = body["icon"]
+            for name, prop in schema.items():
+                if prop["type"] == "last_edited_time":
+                    page["properties"][name] = {**page["properties"][name], "last_edited_time": now}
+            self._pages[page_id] = page
+            return page
+
+    def retrieve_page(self, page_id: str) -> dict:
+        with self._lock:
+            return self._page(page_id)
+
+    def search(self, body: dict) -> dict:
+        """Pages and databases whose title contains `query` (case-insensitive)."""
+        query = (body.get("query") or "").lower()
+        kind = (body.get("filter") or {}).get("value")
+        with self._lock:
+            candidates = ([] if kind == "page" else list(self._databases.values())) + \
+                         ([] if kind == "database" else [p for p in self._pages.values() if not p.get("archived")])
+        results = []
+        for item in candidates:
+            if item["object"] == "database":
+                title = "".join(t.get("plain_text", "") for t in item["title"])
+            else:
+                title = next((plain_text(v) for v in item["properties"].values() if v["type"] == "title"), "")
+            if query in title.lower():
+                results.append(item)
+        return self._paginate(results, body)
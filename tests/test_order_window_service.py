@@ -0,0 +1,90 @@
+"""
+Run from the repository root:
+
+    python -m unittest discover -s tests
+"""
+import unittest
+from datetime import date
+
+from benchmarks import fixtures, replay
+from components.order_chart import window_start
+from services import order_window_service
+
+
+def _total_since(orders, start: date) -> float:
+    return sum(
+        page["properties"]["Total Value"]["formula"]["number"]
+        for page in orders
+        if date.fromisoformat(page["properties"]["Date"]["date"]["start"]) >= start
+    )
+
+
+class FailingQueries:
+    """Let `ok` more databases.query calls through, then fail the next one."""
+
+    def __init__(self, client: replay.ReplayClient, ok: int) -> None:
+        self.query = client.databases.query
+        self.ok = ok
+
+    def __call__(self, **kwargs) -> dict:
+        if self.ok <= 0:
+            raise ConnectionError("Notion is unreachable")
+        self.ok -= 1
+        return self.query(**kwargs)
+
+
+class OrderWindowFailureTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.corpus = fixtures.corpus(2_000)
+        self.client = replay.install(self.corpus)
+        with order_window_service._lock:
+            order_window_service._reset()
+
+    def rollup_total(self, period: str) -> float:
+        return order_window_service.rollup_orders(period, window_start(period))["Total Value"].sum()
+
+    def expected_total(self, period: str) -> float:
+        return _total_since(self.corpus["order"], window_start(period))
+
+    def fail_queries_after(self, ok: int) -> None:
+        self.client.databases.query = FailingQueries(self.client, ok)
+
+    def restore_queries(self) -> None:
+        del self.client.databases.query
+
+    def test_failed_first_load_is_retried(self) -> None:
+        self.fail_queries_after(1)
+        with self.assertRaises(ConnectionError):
+            self.rollup_total("Yearly")
+        self.restore_queries()
+
+        self.assertAlmostEqual(self.rollup_total("Yearly"), self.expected_total("Yearly"), places=2)
+
+    def test_failed_extension_is_retried(self) -> None:
+        self.assertAlmostEqual(self.rollup_total("Weekly"), self.expected_total("Weekly"), places=2)
+
+        # The Yearly window spans several result pages; fail after the first
+        self.fail_queries_after(1)
+        with self.assertRaises(ConnectionError):
+            self.rollup_total("Yearly")
+        self.restore_queries()
+
+        self.assertAlmostEqual(self.rollup_total("Yearly"), self.expected_total("Yearly"), places=2)
+        self.assertAlmostEqual(self.rollup_total("Weekly"), self.expected_total("Weekly"), places=2)
+
+    def test_failed_delta_is_retried(self) -> None:
+        self.rollup_total("Monthly")
+        order_window_service.mark_orders_stale()
+
+        self.fail_queries_after(0)
+        with self.assertRaises(ConnectionError):
+            self.rollup_total("Monthly")
+        self.restore_queries()
+
+        queries = self.client.calls["databases.query"]
+        self.assertAlmostEqual(self.rollup_total("Monthly"), self.expected_total("Monthly"), places=2)
+        self.assertGreater(self.client.calls["databases.query"], queries)
+
+
+if __name__ == "__main__":
+    unittest.main()